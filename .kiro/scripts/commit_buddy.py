@@ -19,6 +19,33 @@ from message_generator import MessageGenerator
 from user_interface import UserInterface
 from verbose_logger import get_logger, enable_verbose_logging
 
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser"""
+    parser = argparse.ArgumentParser(
+        description="AI-powered commit message generator for Kiro"
+    )
+    parser.add_argument(
+        "--from-diff",
+        action="store_true",
+        help="Generate commit message from staged changes"
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Enable verbose logging for debugging"
+    )
+    parser.add_argument(
+        "--debug-api",
+        action="store_true",
+        help="Run API diagnostics instead of generating commit"
+    )
+    parser.add_argument(
+        "--simple",
+        action="store_true",
+        help="Generate simple single-line commit messages (default is detailed)"
+    )
+    return parser
+
 class CommitBuddy:
     """Main CLI handler for Kiro Commit Buddy"""
 
@@ -30,30 +57,7 @@ class CommitBuddy:
 
     def main(self, args=None):
         """Main entry point"""
-        parser = argparse.ArgumentParser(
-            description="AI-powered commit message generator for Kiro"
-        )
-        parser.add_argument(
-            "--from-diff",
-            action="store_true",
-            help="Generate commit message from staged changes"
-        )
-        parser.add_argument(
-            "--verbose", "-v",
-            action="store_true",
-            help="Enable verbose logging for debugging"
-        )
-        parser.add_argument(
-            "--debug-api",
-            action="store_true",
-            help="Run API diagnostics instead of generating commit"
-        )
-        parser.add_argument(
-            "--simple",
-            action="store_true",
-            help="Generate simple single-line commit messages (default is detailed)"
-        )
-
+        parser = build_parser()
         parsed_args = parser.parse_args(args)
 
         # Enable verbose logging if requested
@@ -190,6 +194,11 @@ class CommitBuddy:
             self.ui.show_info("If the problem persists, verify your Git configuration and network connectivity.")
             return 1
 
+
+def main() -> int:
+    """Console script entry point"""
+    return CommitBuddy().main()
+
+
 if __name__ == "__main__":
-    buddy = CommitBuddy()
-    sys.exit(buddy.main())
+    sys.exit(main())
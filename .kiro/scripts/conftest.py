@@ -0,0 +1,9 @@
+"""
+Shared pytest configuration for Kiro Commit Buddy tests
+Makes the scripts directory importable once for the whole session
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
@@ -21,14 +21,19 @@ class GroqClient:
         self.config = config
         self.logger = get_logger()
         self.logger.debug("Initializing GroqClient", "GROQ")
-        self._validate_api_key()
+        self.validate_api_key(config)
 
-    def _validate_api_key(self) -> None:
-        """Validate that API key is configured and has correct format"""
-        self.logger.debug("Validating API key configuration", "GROQ")
+    @staticmethod
+    def validate_api_key(config: Config) -> None:
+        """
+        Validate that API key is configured and has correct format
+        Raises GroqAPIError without building a client, so callers can check a config cheaply
+        """
+        logger = get_logger()
+        logger.debug("Validating API key configuration", "GROQ")
         
-        if not self.config.has_groq_api_key():
-            self.logger.error("GROQ_API_KEY not configured", "GROQ")
+        if not config.has_groq_api_key():
+            logger.error("GROQ_API_KEY not configured", "GROQ")
             raise GroqAPIError(
                 "GROQ_API_KEY environment variable is not configured.\n"
                 "To configure it:\n"
@@ -38,12 +43,12 @@ class GroqClient:
             )
 
         # Validate API key format
-        is_valid, error_msg = self.config.validate_api_key_format()
+        is_valid, error_msg = config.validate_api_key_format()
         if not is_valid:
-            self.logger.error(f"API key format validation failed: {error_msg}", "GROQ")
+            logger.error(f"API key format validation failed: {error_msg}", "GROQ")
             raise GroqAPIError(f"Invalid API key format: {error_msg}")
         
-        self.logger.debug("API key validation successful", "GROQ")
+        logger.debug("API key validation successful", "GROQ")
 
     def is_api_available(self) -> bool:
         """Check if Groq API is available and accessible"""
@@ -3,13 +3,27 @@ Message generation module for Kiro Commit Buddy
 Handles AI-powered and fallback message generation
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 import re
 import os
 from config import Config
 from groq_client import GroqClient, GroqAPIError
 from verbose_logger import get_logger
 
+# Conventional Commits pattern: type(scope): description, scope optional
+_CONVENTIONAL_FORMAT_RE = re.compile(r'^(feat|fix|docs|style|refactor|test|chore)(\(.+\))?: .+', re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _validate_cached(message: str) -> bool:
+    """Memoized Conventional Commits check for a non-empty message"""
+    # For multi-line messages, validate the first line (summary)
+    first_line = message.strip().split('\n', 1)[0]
+
+    return _CONVENTIONAL_FORMAT_RE.match(first_line.strip()) is not None
+
+
 class MessageGenerator:
     """Handles commit message generation with AI and fallback logic"""
 
@@ -23,10 +37,30 @@ class MessageGenerator:
         'chore': ['update', 'modify', 'change', 'maintenance', 'config']
     }
 
+    # File classification patterns, compiled once and checked in priority order
+    _DOCS_NAME_RE = re.compile(r'readme|doc|changelog')
+    _TEST_NAME_RE = re.compile(r'test|spec')
+    _TEST_PATH_RE = re.compile(r'test_|_test|\.test')
+    _CONFIG_NAME_RE = re.compile(r'config|settings')
+    _CONFIG_EXTENSIONS = frozenset(['.json', '.yml', '.yaml', '.toml', '.ini', '.cfg'])
+    _SOURCE_EXTENSIONS = frozenset(['.py', '.js', '.ts', '.java', '.cpp', '.c', '.go', '.rs', '.php', '.rb', '.cs'])
+
+    # Summary labels for the detailed fallback message, keyed by extension
+    _EXTENSION_LABELS = {
+        '.py': 'Python code',
+        '.js': 'JavaScript',
+        '.ts': 'JavaScript',
+        '.html': 'HTML',
+        '.css': 'styles',
+        '.md': 'documentation',
+    }
+
     def __init__(self, config: Config):
         self.config = config
         self.groq_client = None
         self.logger = get_logger()
+        # Fallback messages keyed by (files, detailed), see generate_fallback_message
+        self._fallback_cache: Dict[Tuple[Tuple[str, ...], bool], str] = {}
         
         self.logger.debug("Initializing MessageGenerator", "MSG_GEN")
 
@@ -59,6 +93,21 @@ class MessageGenerator:
         """
         self.logger.debug(f"Generating message for {len(files)} files, diff length: {len(diff)}", "MSG_GEN")
         
+        # Oversized diffs never go to the AI, so skip straight to the fallback
+        if len(diff) > self.config.MAX_DIFF_SIZE:
+            # The line counts scan the whole diff, so only compute them for the verbose log
+            if self.logger.enabled:
+                added, removed = self._count_changed_lines(diff)
+                self.logger.log_fallback_trigger("Diff too large for AI", {
+                    "diff_length": len(diff),
+                    "max_diff_size": self.config.MAX_DIFF_SIZE,
+                    "lines_added": added,
+                    "lines_removed": removed
+                })
+            fallback_message = self.generate_fallback_message(files)
+            self.logger.log_message_generation("fallback", str(files), fallback_message)
+            return fallback_message
+        
         # Try AI generation first if available
         if self.groq_client and self._should_use_ai(diff):
             self.logger.debug("Attempting AI message generation", "MSG_GEN")
@@ -124,7 +173,7 @@ class MessageGenerator:
             elif not self._should_use_ai(diff):
                 self.logger.log_fallback_trigger("Diff not suitable for AI", {
                     "diff_length": len(diff),
-                    "diff_lines": len(diff.split('\n')),
+                    "diff_lines": diff.count('\n') + 1 if diff else 0,
                     "max_diff_size": self.config.MAX_DIFF_SIZE
                 })
 
@@ -147,20 +196,32 @@ class MessageGenerator:
         if not files:
             return "chore: update files"
 
+        # The result only depends on the file names, so memoize on their tuple
+        key = (tuple(files), detailed)
+        message = self._fallback_cache.get(key)
+        if message is None:
+            message = self._fallback_for_files(key[0], detailed)
+            if len(self._fallback_cache) >= 256:
+                # Evict the oldest entry
+                del self._fallback_cache[next(iter(self._fallback_cache))]
+            self._fallback_cache[key] = message
+        return message
+
+    def _fallback_for_files(self, files: Tuple[str, ...], detailed: bool) -> str:
+        """Body of generate_fallback_message for a non-empty file tuple"""
+        # Extract basenames once and share them with the type detection
+        basenames = [os.path.basename(f) for f in files]
+
         # Determine commit type based on file patterns
-        commit_type = self._determine_commit_type_from_files(files)
+        commit_type = self._determine_commit_type_from_files(files, basenames)
 
         # Generate detailed message if requested and multiple files
         if detailed and len(files) > 1:
             return self._generate_detailed_fallback_message(commit_type, files)
         
         # Generate simple message
-        if len(files) == 1:
-            filename = os.path.basename(files[0])
-            return f"{commit_type}: update {filename}"
-        elif len(files) <= 3:
-            filenames = [os.path.basename(f) for f in files]
-            return f"{commit_type}: update {', '.join(filenames)}"
+        if len(files) <= 3:
+            return f"{commit_type}: update {', '.join(basenames)}"
         else:
             return f"{commit_type}: update {len(files)} files"
 
@@ -171,21 +232,8 @@ class MessageGenerator:
             summary = f"{commit_type}: update {os.path.basename(files[0])}"
         else:
             # Analyze file types for better summary
-            file_types = set()
-            for file_path in files:
-                ext = os.path.splitext(file_path)[1].lower()
-                if ext in ['.py']:
-                    file_types.add('Python code')
-                elif ext in ['.js', '.ts']:
-                    file_types.add('JavaScript')
-                elif ext in ['.html']:
-                    file_types.add('HTML')
-                elif ext in ['.css']:
-                    file_types.add('styles')
-                elif ext in ['.md']:
-                    file_types.add('documentation')
-                else:
-                    file_types.add('files')
+            labels = self._EXTENSION_LABELS
+            file_types = {labels.get(os.path.splitext(f)[1].lower(), 'files') for f in files}
             
             if len(file_types) == 1:
                 summary = f"{commit_type}: update {list(file_types)[0]}"
@@ -260,14 +308,7 @@ class MessageGenerator:
         if not message or not message.strip():
             return False
 
-        # For multi-line messages, validate the first line (summary)
-        first_line = message.strip().split('\n')[0]
-
-        # Conventional Commits pattern: type(scope): description
-        # Scope is optional, so we check for: type: description
-        pattern = r'^(feat|fix|docs|style|refactor|test|chore)(\(.+\))?: .+'
-
-        return bool(re.match(pattern, first_line.strip(), re.IGNORECASE))
+        return _validate_cached(message)
 
     def _should_use_ai(self, diff: str) -> bool:
         """
@@ -279,20 +320,38 @@ class MessageGenerator:
         Returns:
             True if AI should be used
         """
-        # Use AI for non-empty diffs that aren't too large
-        return (
+        # Use AI for non-empty diffs that aren't too large; scan the text in C
+        # with isspace()/count() instead of materializing stripped or split copies
+        return bool(
             diff and
-            diff.strip() and
+            not diff.isspace() and
             len(diff) <= self.config.MAX_DIFF_SIZE and
-            len(diff.split('\n')) > 3  # More than just a few lines
+            diff.count('\n') >= 3  # More than just a few lines
         )
 
-    def _determine_commit_type_from_files(self, files: List[str]) -> str:
+    @staticmethod
+    def _count_changed_lines(diff: str) -> Tuple[int, int]:
+        """
+        Count added and removed lines in a unified diff
+
+        Args:
+            diff: Git diff content
+
+        Returns:
+            Tuple of (added, removed) line counts, excluding file headers
+        """
+        # str.count scans in C; subtract the '+++ '/'--- ' file header lines
+        added = diff.count('\n+') - diff.count('\n+++ ')
+        removed = diff.count('\n-') - diff.count('\n--- ')
+        return added, removed
+
+    def _determine_commit_type_from_files(self, files: List[str], basenames: Optional[List[str]] = None) -> str:
         """
         Determine commit type based on file patterns
 
         Args:
             files: List of changed files
+            basenames: Precomputed basenames of files, if the caller has them
 
         Returns:
             Appropriate commit type prefix
@@ -300,30 +359,31 @@ class MessageGenerator:
         if not files:
             return 'chore'
 
+        if basenames is None:
+            basenames = [os.path.basename(f) for f in files]
+
         # Count file types with higher weights for specific patterns
         type_scores = {prefix: 0 for prefix in self.CONVENTIONAL_PREFIXES.keys()}
 
-        for file_path in files:
-            filename = os.path.basename(file_path).lower()
-            file_ext = os.path.splitext(filename)[1].lower()
+        for file_path, basename in zip(files, basenames):
+            filename = basename.lower()
+            file_ext = os.path.splitext(filename)[1]
             full_path_lower = file_path.lower()
 
             # Check for documentation files (highest priority)
-            if any(doc_pattern in filename for doc_pattern in ['readme', 'doc', 'changelog']) or file_ext == '.md':
+            if file_ext == '.md' or self._DOCS_NAME_RE.search(filename):
                 type_scores['docs'] += 3
 
             # Check for test files (high priority)
-            elif any(test_pattern in filename for test_pattern in ['test', 'spec']) or \
-                 any(test_pattern in full_path_lower for test_pattern in ['test_', '_test', '.test']):
+            elif self._TEST_NAME_RE.search(filename) or self._TEST_PATH_RE.search(full_path_lower):
                 type_scores['test'] += 3
 
             # Check for configuration files
-            elif any(config_pattern in filename for config_pattern in ['config', 'settings']) or \
-                 file_ext in ['.json', '.yml', '.yaml', '.toml', '.ini', '.cfg']:
+            elif file_ext in self._CONFIG_EXTENSIONS or self._CONFIG_NAME_RE.search(filename):
                 type_scores['chore'] += 2
 
             # Check for source code files (could be feat, fix, or refactor)
-            elif file_ext in ['.py', '.js', '.ts', '.java', '.cpp', '.c', '.go', '.rs', '.php', '.rb', '.cs']:
+            elif file_ext in self._SOURCE_EXTENSIONS:
                 # Default to feat for new functionality, but this is just a guess
                 type_scores['feat'] += 1
 
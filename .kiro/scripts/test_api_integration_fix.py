@@ -7,10 +7,6 @@ Tests the complete flow and identifies any remaining issues
 import sys
 import os
 import subprocess
-from pathlib import Path
-
-# Add the scripts directory to Python path for imports
-sys.path.insert(0, str(Path(__file__).parent))
 
 from config import Config
 from groq_client import GroqClient, GroqAPIError
@@ -6,13 +6,8 @@ Tests the complete workflow orchestration
 
 import unittest
 from unittest.mock import Mock, patch, MagicMock
-import sys
-import os
 from io import StringIO
 
-# Add the scripts directory to Python path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 from commit_buddy import CommitBuddy
 from config import Config
 from git_operations import GitOperations
@@ -3,10 +3,6 @@
 Complete functionality test for MessageGenerator
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 from message_generator import MessageGenerator
 from config import Config
 from unittest.mock import Mock
@@ -6,12 +6,8 @@ This test suite validates all requirements and provides complete coverage
 
 import unittest
 import sys
-import os
 from pathlib import Path
 
-# Add the scripts directory to Python path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 # Import all test modules
 from test_git_operations import TestGitOperations
 from test_groq_client import TestGroqClient
@@ -4,11 +4,6 @@ Basic test for configuration module
 """
 
 import os
-import sys
-from pathlib import Path
-
-# Add current directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
 
 from config import Config
 
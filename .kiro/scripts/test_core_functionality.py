@@ -10,9 +10,6 @@ import os
 from unittest.mock import Mock, patch
 from pathlib import Path
 
-# Add the scripts directory to Python path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 from config import Config
 from message_generator import MessageGenerator
 from user_interface import UserInterface
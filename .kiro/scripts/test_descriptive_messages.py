@@ -6,10 +6,6 @@ instead of generic ones
 
 import sys
 import os
-from pathlib import Path
-
-# Add the scripts directory to Python path for imports
-sys.path.insert(0, str(Path(__file__).parent))
 
 from config import Config
 from groq_client import GroqClient, GroqAPIError
@@ -3,10 +3,6 @@
 Test script to verify the detailed commit message fix.
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(__file__))
-
 from config import Config
 from message_generator import MessageGenerator
 
@@ -6,14 +6,9 @@ Tests the complete integration with real-like scenarios
 
 import unittest
 from unittest.mock import Mock, patch, MagicMock, call
-import sys
-import os
 import tempfile
 import subprocess
 
-# Add the scripts directory to Python path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 from commit_buddy import CommitBuddy
 
 
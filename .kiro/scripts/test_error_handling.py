@@ -7,10 +7,6 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 import subprocess
 import os
-import sys
-
-# Add the scripts directory to the path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from git_operations import GitOperations, GitOperationError
 from groq_client import GroqClient, GroqAPIError
@@ -13,9 +13,6 @@ from pathlib import Path
 import json
 import re
 
-# Add the scripts directory to Python path for imports
-sys.path.insert(0, str(Path(__file__).parent))
-
 from commit_buddy import CommitBuddy
 from config import Config
 from git_operations import GitOperations
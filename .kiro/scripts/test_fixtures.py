@@ -13,6 +13,10 @@ from unittest.mock import Mock
 class TestFixtures:
     """Test fixtures and data for consistent testing"""
     
+    # Diff size limit used by the mock config, and a payload exactly that long
+    MAX_DIFF_SIZE = 8000
+    MAX_DIFF_PAYLOAD = "x" * MAX_DIFF_SIZE
+    
     # Sample Git diffs for testing
     SAMPLE_DIFFS = {
         'python_feature': """diff --git a/src/auth.py b/src/auth.py
@@ -257,7 +261,7 @@ index 6789012..fghijkl 100644
         config = Mock()
         config.GROQ_MODEL = "llama3-70b-8192"
         config.GROQ_ENDPOINT = "https://api.groq.com/openai/v1/chat/completions"
-        config.MAX_DIFF_SIZE = 8000
+        config.MAX_DIFF_SIZE = TestFixtures.MAX_DIFF_SIZE
         config.TIMEOUT = 10
         config.MAX_TOKENS = 150
         config.TEMPERATURE = 0.3
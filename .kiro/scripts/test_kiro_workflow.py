@@ -6,10 +6,18 @@ Creates test files and validates the full commit process
 
 import os
 import sys
+import shutil
 import subprocess
 import tempfile
 from pathlib import Path
 
+# Paths are relative to the repository root, where these tests are run
+SCRIPT_PATH = Path(".kiro/scripts/commit_buddy.py")
+HOOK_PATH = Path(".kiro/hooks/commit.yml")
+
+# Run git in the C locale so its error messages are not translated
+GIT_ENV = {**os.environ, "LC_ALL": "C"}
+
 def test_complete_workflow():
     """Test the complete workflow with actual file changes"""
     print("🔍 Testing complete Kiro workflow...")
@@ -24,66 +32,53 @@ def test_complete_workflow():
         
         print(f"✅ Created test file: {test_file}")
         
-        # Add file to git staging (if in a git repo)
+        # Work out the scenario up front so commit_buddy only has to run once
+        # Without git there is no workflow to exercise, so skip the spawn entirely
+        if not shutil.which('git'):
+            print("ℹ️ Git not available - skipping workflow execution")
+            return True
+        
+        # A single `git add` both stages the file and tells us whether we are in a repo
         try:
-            result = subprocess.run(['git', 'add', str(test_file)], 
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                print("✅ Added test file to git staging")
-                
-                # Now test the commit buddy with staged changes
-                script_path = Path(".kiro/scripts/commit_buddy.py")
-                result = subprocess.run([
-                    sys.executable, str(script_path), "--from-diff"
-                ], capture_output=True, text=True, timeout=30, input="n\n")  # Auto-cancel the commit
-                
-                print(f"Command output: {result.stdout}")
-                if result.stderr:
-                    print(f"Command errors: {result.stderr}")
-                
-                # The command should work and show a proposed message
-                if "mensaje propuesto" in result.stdout.lower() or "proposed message" in result.stdout.lower():
-                    print("✅ Command successfully generated a commit message")
-                elif "no hay cambios staged" in result.stdout.lower():
-                    print("ℹ️ No staged changes detected (expected if git add failed)")
-                else:
-                    print("✅ Command executed successfully")
-                
-                # Clean up git staging
-                subprocess.run(['git', 'reset', 'HEAD', str(test_file)], 
-                             capture_output=True, timeout=5)
-                
-            else:
-                print("ℹ️ Not in a git repository or git add failed - testing without staging")
-                
-                # Test without staged changes
-                script_path = Path(".kiro/scripts/commit_buddy.py")
-                result = subprocess.run([
-                    sys.executable, str(script_path), "--from-diff"
-                ], capture_output=True, text=True, timeout=15)
-                
-                if result.returncode == 0 and "No hay cambios staged" in result.stdout:
-                    print("✅ Command correctly handled no staged changes scenario")
-                elif result.returncode == 1 and "No estás en un repositorio Git" in result.stdout:
-                    print("✅ Command correctly handled non-git repository scenario")
-                else:
-                    print(f"✅ Command executed with exit code {result.returncode}")
-                
+            result = subprocess.run(['git', 'add', '--', str(test_file)],
+                                    capture_output=True, text=True, timeout=5, env=GIT_ENV)
+            staged = result.returncode == 0
+            # git exits with 128 outside a repository
+            in_repo = staged or not (result.returncode == 128
+                                     and "not a git repository" in result.stderr.lower())
         except subprocess.TimeoutExpired:
             print("⚠️ Git operations timed out")
-        except FileNotFoundError:
-            print("ℹ️ Git not available - testing without git operations")
-            
-            # Test the command anyway
-            script_path = Path(".kiro/scripts/commit_buddy.py")
+            return True
+        
+        if staged:
+            print("✅ Added test file to git staging")
+            expected_patterns = ("mensaje propuesto", "proposed commit message")
+        elif in_repo:
+            print("ℹ️ git add failed - testing without staging")
+            expected_patterns = ("no hay cambios staged", "no staged changes")
+        else:
+            print("ℹ️ Not in a git repository - testing without staging")
+            expected_patterns = ("no estás en un repositorio git", "not in a git repository")
+        
+        try:
             result = subprocess.run([
-                sys.executable, str(script_path), "--from-diff"
-            ], capture_output=True, text=True, timeout=15)
-            
-            if "No estás en un repositorio Git" in result.stdout:
-                print("✅ Command correctly detected non-git environment")
-            else:
-                print(f"✅ Command executed with output: {result.stdout[:100]}...")
+                sys.executable, str(SCRIPT_PATH), "--from-diff"
+            ], capture_output=True, text=True, timeout=30, input="n\n")  # Auto-cancel the commit
+        finally:
+            if staged:
+                # Clean up git staging
+                subprocess.run(['git', 'restore', '--staged', '--', str(test_file)],
+                             capture_output=True, timeout=5, env=GIT_ENV)
+        
+        print(f"Command output: {result.stdout}")
+        if result.stderr:
+            print(f"Command errors: {result.stderr}")
+        
+        output = (result.stdout + result.stderr).lower()
+        if any(pattern in output for pattern in expected_patterns):
+            print("✅ Command handled the detected scenario correctly")
+        else:
+            print(f"✅ Command executed with exit code {result.returncode}")
         
         return True
         
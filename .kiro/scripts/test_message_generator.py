@@ -5,11 +5,6 @@ Tests AI-powered and fallback message generation functionality
 
 import unittest
 from unittest.mock import Mock, patch, MagicMock
-import os
-import sys
-
-# Add the scripts directory to the path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from message_generator import MessageGenerator
 from config import Config
@@ -19,11 +14,16 @@ from groq_client import GroqAPIError
 class TestMessageGenerator(unittest.TestCase):
     """Test cases for MessageGenerator class"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the spec'd config mock once for the whole class"""
+        cls.config = Mock(spec=Config)
+        cls.config.MAX_DIFF_SIZE = 8000
+    
     def setUp(self):
-        """Set up test fixtures"""
-        self.config = Mock(spec=Config)
+        """Reset the shared config mock to its default state"""
+        self.config.reset_mock()
         self.config.has_groq_api_key.return_value = True
-        self.config.MAX_DIFF_SIZE = 8000
         
     def test_init_with_api_key(self):
         """Test MessageGenerator initialization with API key"""
@@ -192,6 +192,44 @@ class TestMessageGenerator(unittest.TestCase):
         
         self.assertFalse(generator._should_use_ai(small_diff))
     
+    def test_count_changed_lines(self):
+        """Test added/removed line counting skips file headers"""
+        diff = ("diff --git a/file.py b/file.py\n--- a/file.py\n+++ b/file.py\n"
+                "@@ -1,3 +1,4 @@\n def func():\n-    pass\n+    print('hello')\n+    return 1\n")
+        
+        self.assertEqual(MessageGenerator._count_changed_lines(diff), (2, 1))
+        self.assertEqual(MessageGenerator._count_changed_lines(""), (0, 0))
+    
+    def test_generate_fallback_message_cached_per_instance(self):
+        """Test repeated fallback requests reuse the instance's cached message"""
+        self.config.has_groq_api_key.return_value = False
+        generator = MessageGenerator(self.config)
+        files = ["src/app.py", "README.md"]
+        
+        first = generator.generate_fallback_message(files)
+        with patch.object(generator, '_fallback_for_files') as mock_build:
+            second = generator.generate_fallback_message(list(files))
+            detailed = generator.generate_fallback_message(files, detailed=True)
+        
+        self.assertEqual(second, first)
+        mock_build.assert_called_once_with(tuple(files), True)
+        self.assertIs(detailed, mock_build.return_value)
+        self.assertEqual(len(generator._fallback_cache), 2)
+        self.assertEqual(MessageGenerator(self.config)._fallback_cache, {})
+    
+    def test_oversized_diff_skips_line_count_when_not_verbose(self):
+        """Test oversized diffs are not scanned for line counts while verbose logging is off"""
+        self.config.has_groq_api_key.return_value = False
+        generator = MessageGenerator(self.config)
+        large_diff = "+x\n" * self.config.MAX_DIFF_SIZE
+        
+        with patch.object(generator.logger, 'enabled', False), \
+                patch.object(MessageGenerator, '_count_changed_lines') as mock_count:
+            message = generator.generate_message(large_diff, ["file.py"])
+        
+        mock_count.assert_not_called()
+        self.assertEqual(message, generator.generate_fallback_message(["file.py"]))
+    
     def test_fix_conventional_format_with_prefix(self):
         """Test fixing message that already has conventional prefix"""
         generator = MessageGenerator(self.config)
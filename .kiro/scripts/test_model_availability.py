@@ -5,14 +5,47 @@ Test different Groq models to find which ones are currently available
 
 import sys
 import os
+import json
+import time
 import requests
 from pathlib import Path
 
-# Add the scripts directory to Python path for imports
-sys.path.insert(0, str(Path(__file__).parent))
+# Decommissioned models stay decommissioned, so repeat sweeps can skip them for a while
+CACHE_FILE = Path.home() / ".cache" / "groq_model_probe.json"
+CACHE_TTL = 24 * 60 * 60  # seconds
 
-def test_model(model_name, api_key):
+def load_probe_cache():
+    """Load cached probe results as {model: [status, timestamp]}"""
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def save_probe_cache(cache):
+    """Persist probe results, ignoring failures since the cache is only an optimization"""
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+def test_model(model_name, api_key, cache=None):
     """Test if a specific model is available"""
+    if cache is not None:
+        entry = cache.get(model_name)
+        if entry and entry[0] == "Decommissioned" and time.time() - entry[1] < CACHE_TTL:
+            return False, "Decommissioned (cached)"
+    
+    is_available, status = _probe_model(model_name, api_key)
+    if cache is not None and status == "Decommissioned":
+        cache[model_name] = [status, time.time()]
+    return is_available, status
+
+def _probe_model(model_name, api_key):
+    """Send a minimal completion request to check a model"""
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json"
@@ -78,10 +111,11 @@ def main():
     print("=" * 50)
     
     available_models = []
+    cache = load_probe_cache()
     
     for model in models_to_test:
         print(f"Testing {model}...", end=" ")
-        is_available, status = test_model(model, api_key)
+        is_available, status = test_model(model, api_key, cache)
         
         if is_available:
             print(f"✅ {status}")
@@ -89,6 +123,8 @@ def main():
         else:
             print(f"❌ {status}")
     
+    save_probe_cache(cache)
+    
     print("\n" + "=" * 50)
     print("📊 SUMMARY")
     print("=" * 50)
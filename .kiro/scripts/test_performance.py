@@ -7,98 +7,118 @@ Tests performance characteristics and edge cases
 import unittest
 import time
 import sys
-import os
 from unittest.mock import Mock, patch
 import threading
 import concurrent.futures
-
-# Add the scripts directory to Python path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import multiprocessing
+import requests
 
 from git_operations import GitOperations
-from groq_client import GroqClient
+from groq_client import GroqClient, GroqAPIError
 from message_generator import MessageGenerator
 from user_interface import UserInterface
 from commit_buddy import CommitBuddy
 from test_fixtures import TestFixtures
 
 
+def _bench(fn, n):
+    """Call fn n times and return the average time per call in nanoseconds"""
+    start = time.perf_counter_ns()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter_ns() - start) / n
+
+
+# Canned "nothing staged" git response shared by the rapid-operations test
+_NO_STAGED_RESPONSE = TestFixtures.create_mock_subprocess_response(
+    TestFixtures.GIT_RESPONSES['no_staged_files']
+)
+
+
+# Worker state for the multi-process stress test; module level so it can be pickled
+_MEDIUM_PAYLOAD = "x" * 1000
+_worker_generator = None
+
+
+def _process_large_diff(i):
+    """Generate a message for one large diff, reusing a generator per worker process"""
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = MessageGenerator(TestFixtures.create_mock_config())
+    
+    large_diff = f"diff --git a/file{i}.py b/file{i}.py\n+{_MEDIUM_PAYLOAD}"
+    return _worker_generator.generate_message(large_diff, [f'file{i}.py'])
+
+
 class TestPerformance(unittest.TestCase):
     """Performance tests for various components"""
     
-    def setUp(self):
-        self.config = TestFixtures.create_mock_config()
+    @classmethod
+    def setUpClass(cls):
+        cls.config = TestFixtures.create_mock_config()
     
     def test_git_operations_performance(self):
         """Test Git operations performance under normal conditions"""
         git_ops = GitOperations()
         
+        # Build the mock response once so the loop measures only the wrapper
+        mock_response = TestFixtures.create_mock_subprocess_response(
+            TestFixtures.GIT_RESPONSES['valid_repo']
+        )
+        
         with patch('subprocess.run') as mock_run:
-            mock_run.return_value = TestFixtures.create_mock_subprocess_response(
-                TestFixtures.GIT_RESPONSES['valid_repo']
-            )
+            mock_run.return_value = mock_response
             
             # Measure time for multiple operations
-            start_time = time.time()
-            for _ in range(100):
-                git_ops.is_git_repository()
-            end_time = time.time()
-            
-            avg_time = (end_time - start_time) / 100
-            self.assertLess(avg_time, 0.01, "Git operations should be fast (< 10ms average)")
+            avg_ns = _bench(git_ops.is_git_repository, 1000)
+            self.assertLess(avg_ns, 10_000_000, "Git operations should be fast (< 10ms average)")
     
     def test_message_generation_performance(self):
         """Test message generation performance"""
         generator = MessageGenerator(self.config)
         
-        # Test fallback message generation performance
-        files = ['file1.py', 'file2.py', 'file3.py']
-        
-        start_time = time.time()
-        for _ in range(1000):
-            generator.generate_fallback_message(files)
-        end_time = time.time()
+        # Test fallback message generation performance; every call gets a new file
+        # list so the generator's fallback cache never hits and generation is timed
+        file_lists = iter([[f'file{i}.py', f'module{i}.py', f'test_{i}.py'] for i in range(5000)])
         
-        avg_time = (end_time - start_time) / 1000
-        self.assertLess(avg_time, 0.001, "Fallback message generation should be very fast (< 1ms)")
+        avg_ns = _bench(lambda: generator.generate_fallback_message(next(file_lists)), 5000)
+        self.assertLess(avg_ns, 1_000_000, "Fallback message generation should be very fast (< 1ms)")
     
     def test_conventional_format_validation_performance(self):
         """Test conventional format validation performance"""
         generator = MessageGenerator(self.config)
         
         messages = TestFixtures.VALID_CONVENTIONAL_MESSAGES + TestFixtures.INVALID_CONVENTIONAL_MESSAGES
+        all_messages = messages * 10
+        validate = generator.validate_conventional_format
         
-        start_time = time.time()
-        for _ in range(100):
-            for message in messages:
-                generator.validate_conventional_format(message)
-        end_time = time.time()
+        def validate_all():
+            for message in all_messages:
+                validate(message)
         
-        total_validations = 100 * len(messages)
-        avg_time = (end_time - start_time) / total_validations
-        self.assertLess(avg_time, 0.0001, "Format validation should be very fast (< 0.1ms)")
+        avg_ns = _bench(validate_all, 100) / len(all_messages)
+        self.assertLess(avg_ns, 100_000, "Format validation should be very fast (< 0.1ms)")
     
     @patch('requests.post')
     def test_api_client_timeout_handling(self, mock_post):
         """Test API client handles timeouts gracefully"""
-        # Mock slow response
+        # Time out immediately; sleeping adds nothing to the error path under test
         def slow_response(*args, **kwargs):
-            time.sleep(0.1)  # Simulate slow response
-            return TestFixtures.create_mock_http_response(
-                200, TestFixtures.GROQ_API_RESPONSES['success']
-            )
+            raise requests.exceptions.Timeout()
         
         mock_post.side_effect = slow_response
         
         client = GroqClient(self.config)
         
-        start_time = time.time()
-        try:
+        # Other tests may leave verbose logging on; keep the request logging out of the error path
+        start_time = time.perf_counter()
+        with patch.object(client.logger, 'enabled', False), self.assertRaises(GroqAPIError) as ctx:
             client.generate_commit_message("test diff")
-        except Exception:
-            pass  # Expected for timeout
-        end_time = time.time()
+        end_time = time.perf_counter()
         
+        # The timeout surfaces as a network error, without retrying the request
+        self.assertIn("Network error", str(ctx.exception))
+        mock_post.assert_called_once()
         # Should not take longer than configured timeout + buffer
         self.assertLess(end_time - start_time, self.config.TIMEOUT + 2)
 
@@ -106,20 +126,30 @@ class TestPerformance(unittest.TestCase):
 class TestStressConditions(unittest.TestCase):
     """Stress tests for edge cases and high load"""
     
-    def setUp(self):
-        self.config = TestFixtures.create_mock_config()
+    @classmethod
+    def setUpClass(cls):
+        # Create the worker threads once so tests measure the work, not pool startup
+        cls.pool = concurrent.futures.ThreadPoolExecutor(max_workers=10)
+        # Build the large diff payloads once instead of per test or per iteration
+        cls.large_payload = "x" * 50000
+        cls.MANY_FILES_1K = [f'file{i}.py' for i in range(1000)]
+        cls.config = TestFixtures.create_mock_config()
+        # None of these tests change generator state, so one instance serves them all
+        cls.generator = MessageGenerator(cls.config)
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown(wait=True)
     
     def test_large_diff_handling(self):
         """Test handling of very large diffs"""
-        generator = MessageGenerator(self.config)
-        
         # Create a very large diff
-        large_diff = "diff --git a/file.py b/file.py\n" + "+" + "x" * 50000
+        large_diff = f"diff --git a/file.py b/file.py\n+{self.large_payload}"
         files = ['file.py']
         
-        start_time = time.time()
-        message = generator.generate_message(large_diff, files)
-        end_time = time.time()
+        start_time = time.perf_counter()
+        message = self.generator.generate_message(large_diff, files)
+        end_time = time.perf_counter()
         
         # Should handle large diffs gracefully and quickly
         self.assertIsNotNone(message)
@@ -128,14 +158,9 @@ class TestStressConditions(unittest.TestCase):
     
     def test_many_files_handling(self):
         """Test handling of commits with many files"""
-        generator = MessageGenerator(self.config)
-        
-        # Create a list with many files
-        many_files = [f'file{i}.py' for i in range(1000)]
-        
-        start_time = time.time()
-        message = generator.generate_fallback_message(many_files)
-        end_time = time.time()
+        start_time = time.perf_counter()
+        message = self.generator.generate_fallback_message(self.MANY_FILES_1K)
+        end_time = time.perf_counter()
         
         # Should handle many files efficiently
         self.assertIsNotNone(message)
@@ -145,31 +170,31 @@ class TestStressConditions(unittest.TestCase):
     def test_concurrent_operations(self):
         """Test concurrent operations don't interfere"""
         def run_git_operation():
-            git_ops = GitOperations()
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value = TestFixtures.create_mock_subprocess_response(
-                    TestFixtures.GIT_RESPONSES['valid_repo']
-                )
-                return git_ops.is_git_repository()
-        
-        # Run multiple operations concurrently
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(run_git_operation) for _ in range(50)]
-            results = [future.result() for future in concurrent.futures.as_completed(futures)]
+            return GitOperations().is_git_repository()
+        
+        # Patch once for all workers so they don't contend on the patcher
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = TestFixtures.create_mock_subprocess_response(
+                TestFixtures.GIT_RESPONSES['valid_repo']
+            )
+            
+            # Run multiple operations concurrently
+            futures = [self.pool.submit(run_git_operation) for _ in range(50)]
+            results = [future.result() for future in futures]
         
         # All operations should succeed
         self.assertTrue(all(results), "All concurrent operations should succeed")
     
     def test_memory_usage_with_large_data(self):
         """Test memory usage doesn't grow excessively with large data"""
-        generator = MessageGenerator(self.config)
-        
-        # Process many large diffs
-        for i in range(100):
-            large_diff = f"diff --git a/file{i}.py b/file{i}.py\n" + "+" + "x" * 1000
-            files = [f'file{i}.py']
-            
-            message = generator.generate_message(large_diff, files)
+        # Process many large diffs across worker processes. They are spawned rather
+        # than forked, since this process already runs the class's thread pool
+        spawn = multiprocessing.get_context("spawn")
+        with concurrent.futures.ProcessPoolExecutor(mp_context=spawn) as executor:
+            messages = list(executor.map(_process_large_diff, range(100), chunksize=10))
+        
+        self.assertEqual(len(messages), 100)
+        for message in messages:
             self.assertIsNotNone(message)
         
         # Test passes if no memory errors occur
@@ -177,8 +202,6 @@ class TestStressConditions(unittest.TestCase):
     
     def test_unicode_and_special_characters(self):
         """Test handling of unicode and special characters"""
-        generator = MessageGenerator(self.config)
-        
         # Test with various unicode characters
         unicode_files = [
             'файл.py',  # Cyrillic
@@ -191,15 +214,18 @@ class TestStressConditions(unittest.TestCase):
             'file.with.dots.py'
         ]
         
-        for filename in unicode_files:
-            with self.subTest(filename=filename):
-                message = generator.generate_fallback_message([filename])
-                self.assertIsNotNone(message)
-                self.assertTrue(any(prefix in message for prefix in TestFixtures.CONVENTIONAL_PREFIXES))
+        # One call over all files exercises the multi-file path
+        message = self.generator.generate_fallback_message(unicode_files)
+        self.assertIsNotNone(message)
+        self.assertTrue(any(prefix in message for prefix in TestFixtures.CONVENTIONAL_PREFIXES))
+        
+        # Up to three files are listed by name, so non-ASCII names must survive
+        message = self.generator.generate_fallback_message(unicode_files[:3])
+        for filename in unicode_files[:3]:
+            self.assertIn(filename, message)
     
     def test_empty_and_null_inputs(self):
         """Test handling of empty and null inputs"""
-        generator = MessageGenerator(self.config)
         git_ops = GitOperations()
         ui = UserInterface()
         
@@ -210,7 +236,7 @@ class TestStressConditions(unittest.TestCase):
             with self.subTest(input=empty_input):
                 # Message generator should handle empty inputs gracefully
                 if empty_input is not None:
-                    result = generator.validate_conventional_format(empty_input)
+                    result = self.generator.validate_conventional_format(empty_input)
                     self.assertFalse(result)
                 
                 # UI should handle empty inputs
@@ -225,20 +251,16 @@ class TestStressConditions(unittest.TestCase):
     
     def test_rapid_successive_operations(self):
         """Test rapid successive operations"""
-        commit_buddy = CommitBuddy()
+        handle_from_diff = CommitBuddy().handle_from_diff
         
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = TestFixtures.create_mock_subprocess_response(
-                TestFixtures.GIT_RESPONSES['no_staged_files']
-            )
-            
-            # Perform rapid successive operations
-            start_time = time.time()
-            for _ in range(50):
-                result = commit_buddy.handle_from_diff()
-                self.assertEqual(result, 0)  # Should handle no staged files gracefully
-            end_time = time.time()
+        with patch('subprocess.run', return_value=_NO_STAGED_RESPONSE):
+            # Perform rapid successive operations, checking results after timing
+            start_time = time.perf_counter()
+            results = [handle_from_diff() for _ in range(50)]
+            end_time = time.perf_counter()
             
+            # Should handle no staged files gracefully
+            self.assertEqual(results, [0] * 50)
             # Should complete quickly
             self.assertLess(end_time - start_time, 5.0, "Rapid operations should complete quickly")
 
@@ -246,23 +268,24 @@ class TestStressConditions(unittest.TestCase):
 class TestEdgeCases(unittest.TestCase):
     """Test edge cases and boundary conditions"""
     
-    def setUp(self):
-        self.config = TestFixtures.create_mock_config()
+    @classmethod
+    def setUpClass(cls):
+        cls.config = TestFixtures.create_mock_config()
+        # Built outside the timed regions so only message generation is measured
+        cls.MANY_FILES_10K = [f'file{i}.py' for i in range(10000)]
     
     def test_boundary_diff_sizes(self):
         """Test diffs at boundary sizes"""
         generator = MessageGenerator(self.config)
         
         # Test diff exactly at MAX_DIFF_SIZE
-        boundary_diff = "x" * self.config.MAX_DIFF_SIZE
         files = ['file.py']
         
-        message = generator.generate_message(boundary_diff, files)
+        message = generator.generate_message(TestFixtures.MAX_DIFF_PAYLOAD, files)
         self.assertIsNotNone(message)
         
         # Test diff just over MAX_DIFF_SIZE
-        over_boundary_diff = "x" * (self.config.MAX_DIFF_SIZE + 1)
-        message = generator.generate_message(over_boundary_diff, files)
+        message = generator.generate_message(TestFixtures.MAX_DIFF_PAYLOAD + "x", files)
         self.assertIsNotNone(message)
         self.assertTrue(message.startswith('feat:'))  # Should use fallback
     
@@ -271,11 +294,9 @@ class TestEdgeCases(unittest.TestCase):
         generator = MessageGenerator(self.config)
         
         # Test with very large number of files
-        max_files = [f'file{i}.py' for i in range(10000)]
-        
-        start_time = time.time()
-        message = generator.generate_fallback_message(max_files)
-        end_time = time.time()
+        start_time = time.perf_counter()
+        message = generator.generate_fallback_message(self.MANY_FILES_10K)
+        end_time = time.perf_counter()
         
         self.assertIsNotNone(message)
         self.assertIn('10000 files', message)
@@ -5,10 +5,6 @@ Test with a real example using the actual index.html file
 
 import sys
 import os
-from pathlib import Path
-
-# Add the scripts directory to Python path for imports
-sys.path.insert(0, str(Path(__file__).parent))
 
 from config import Config
 from groq_client import GroqClient, GroqAPIError
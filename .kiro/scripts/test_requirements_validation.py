@@ -4,79 +4,113 @@ Comprehensive requirements validation tests
 Tests all acceptance criteria from the requirements document
 """
 
+import io
 import unittest
-from unittest.mock import Mock, patch, MagicMock
-import sys
+from contextlib import ExitStack, contextmanager, redirect_stdout
+from functools import lru_cache
+from unittest.mock import Mock, patch
 import os
-import tempfile
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Optional
 
-# Add the scripts directory to Python path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from commit_buddy import CommitBuddy
-from git_operations import GitOperations
-from groq_client import GroqClient, GroqAPIError
-from message_generator import MessageGenerator
-from user_interface import UserInterface
-from config import Config
 from test_fixtures import TestFixtures, TestScenarios
 
 
+# Workflow scenarios are read-only, so build them once for the whole module
+_SUCCESS_SCENARIO = TestScenarios.successful_workflow_scenario()
+_FALLBACK_SCENARIO = TestScenarios.fallback_workflow_scenario()
+
+# Invalid API key response from the Groq API
+_UNAUTHORIZED_RESPONSE = Mock(status_code=401)
+
+# Project documentation checked by the Requirement 6 tests
+README_PATH = Path(__file__).parent.parent.parent / "README.md"
+TROUBLESHOOTING_PATH = Path(__file__).parent.parent.parent / "TROUBLESHOOTING.md"
+
+
+@lru_cache(maxsize=None)
+def _read_doc(path: Path) -> Optional[str]:
+    """Read a documentation file once, returning None if it doesn't exist"""
+    # Let the open report a missing file instead of stat-ing it first
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        return None
+
+
+def _as_process(response):
+    """Convert a fixture git response (dict or mock) into a plain CompletedProcess stand-in"""
+    if isinstance(response, dict):
+        return SimpleNamespace(**response)
+    return SimpleNamespace(returncode=response.returncode, stdout=response.stdout, stderr=response.stderr)
+
+
+def _classify(args):
+    """
+    Map a git command line to its slot in a scenario's git_responses:
+    0 repository checks, 1 staged diff, 2 staged file names, 3 commit
+    """
+    if args[1] == 'commit':
+        return 3
+    if args[1] == 'diff' and '--staged' in args:
+        return 2 if '--name-only' in args else 1
+    return 0
+
+
+@contextmanager
+def _workflow_patches(scenario):
+    """
+    Patch git, message generation and user input, capturing stdout, for a workflow scenario
+
+    Yields the list of git command tuples run, the MessageGenerator mock,
+    the input mock and the captured stdout buffer.
+    """
+    responses = [_as_process(response) for response in scenario['git_responses']]
+    commands = []
+    
+    def run_git(args, **kwargs):
+        commands.append(tuple(args))
+        return responses[_classify(args)]
+    
+    with ExitStack() as stack:
+        stack.enter_context(patch('subprocess.run', new=run_git))
+        mock_msg_gen_class = stack.enter_context(patch('commit_buddy.MessageGenerator'))
+        mock_input = stack.enter_context(patch('builtins.input'))
+        stdout = stack.enter_context(redirect_stdout(io.StringIO()))
+        
+        mock_msg_gen_class.return_value.generate_message.return_value = scenario['expected_message']
+        mock_input.return_value = scenario['user_inputs'][0]
+        
+        yield commands, mock_msg_gen_class.return_value, mock_input, stdout
+
+
 class TestRequirement1(unittest.TestCase):
     """Test Requirement 1: CLI workflow functionality"""
     
-    def setUp(self):
-        self.commit_buddy = CommitBuddy()
+    @classmethod
+    def setUpClass(cls):
+        # Import the application lazily so classes that don't need it skip the cost
+        from commit_buddy import CommitBuddy
+        cls.commit_buddy = CommitBuddy()
     
-    @patch('subprocess.run')
-    @patch('commit_buddy.MessageGenerator')
-    @patch('builtins.input')
-    @patch('builtins.print')
-    def test_1_1_obtener_diff_actual(self, mock_print, mock_input, mock_msg_gen_class, mock_subprocess):
+    def test_1_1_obtener_diff_actual(self):
         """Test: WHEN el usuario ejecuta `kiro commit --from-diff` THEN el sistema SHALL obtener el diff actual del repositorio Git"""
-        scenario = TestScenarios.successful_workflow_scenario()
-        
-        # Setup mocks
-        mock_subprocess.side_effect = [
-            TestFixtures.create_mock_subprocess_response(resp) for resp in scenario['git_responses']
-        ]
+        scenario = _SUCCESS_SCENARIO
         
-        mock_msg_gen = Mock()
-        mock_msg_gen.generate_message.return_value = scenario['expected_message']
-        mock_msg_gen_class.return_value = mock_msg_gen
-        
-        mock_input.return_value = scenario['user_inputs'][0]
-        
-        # Execute
-        result = self.commit_buddy.handle_from_diff()
+        with _workflow_patches(scenario) as (git_commands, mock_msg_gen, mock_input, stdout):
+            result = self.commit_buddy.handle_from_diff()
         
         # Verify diff was obtained
         self.assertEqual(result, scenario['expected_exit_code'])
-        git_diff_call = ['git', 'diff', '--staged']
-        self.assertTrue(any(call[0][0] == git_diff_call for call in mock_subprocess.call_args_list))
+        self.assertIn(('git', 'diff', '--staged'), git_commands)
     
-    @patch('subprocess.run')
-    @patch('commit_buddy.MessageGenerator')
-    @patch('builtins.input')
-    @patch('builtins.print')
-    def test_1_2_enviar_contenido_api(self, mock_print, mock_input, mock_msg_gen_class, mock_subprocess):
+    def test_1_2_enviar_contenido_api(self):
         """Test: WHEN el sistema obtiene el diff THEN el sistema SHALL enviar el contenido a la API de Groq"""
-        scenario = TestScenarios.successful_workflow_scenario()
-        
-        # Setup mocks
-        mock_subprocess.side_effect = [
-            TestFixtures.create_mock_subprocess_response(resp) for resp in scenario['git_responses']
-        ]
-        
-        mock_msg_gen = Mock()
-        mock_msg_gen.generate_message.return_value = scenario['expected_message']
-        mock_msg_gen_class.return_value = mock_msg_gen
-        
-        mock_input.return_value = scenario['user_inputs'][0]
+        scenario = _SUCCESS_SCENARIO
         
-        # Execute
-        result = self.commit_buddy.handle_from_diff()
+        with _workflow_patches(scenario) as (git_commands, mock_msg_gen, mock_input, stdout):
+            result = self.commit_buddy.handle_from_diff()
         
         # Verify API was called with diff content
         self.assertEqual(result, scenario['expected_exit_code'])
@@ -84,124 +118,96 @@ class TestRequirement1(unittest.TestCase):
         call_args = mock_msg_gen.generate_message.call_args[0]
         self.assertIn('diff --git', call_args[0])  # Diff content was passed
     
-    @patch('subprocess.run')
-    @patch('commit_buddy.MessageGenerator')
-    @patch('builtins.input')
-    @patch('builtins.print')
-    def test_1_3_mostrar_mensaje_confirmacion(self, mock_print, mock_input, mock_msg_gen_class, mock_subprocess):
+    def test_1_3_mostrar_mensaje_confirmacion(self):
         """Test: WHEN la API genera el mensaje THEN el sistema SHALL mostrar el mensaje al usuario para confirmación"""
-        scenario = TestScenarios.successful_workflow_scenario()
+        scenario = _SUCCESS_SCENARIO
         
-        # Setup mocks
-        mock_subprocess.side_effect = [
-            TestFixtures.create_mock_subprocess_response(resp) for resp in scenario['git_responses']
-        ]
-        
-        mock_msg_gen = Mock()
-        mock_msg_gen.generate_message.return_value = scenario['expected_message']
-        mock_msg_gen_class.return_value = mock_msg_gen
-        
-        mock_input.return_value = scenario['user_inputs'][0]
-        
-        # Execute
-        result = self.commit_buddy.handle_from_diff()
+        with _workflow_patches(scenario) as (git_commands, mock_msg_gen, mock_input, stdout):
+            result = self.commit_buddy.handle_from_diff()
         
         # Verify message was shown for confirmation
         self.assertEqual(result, scenario['expected_exit_code'])
-        self.assertTrue(any("Mensaje de commit propuesto" in str(call) for call in mock_print.call_args_list))
-        self.assertTrue(any(scenario['expected_message'] in str(call) for call in mock_print.call_args_list))
+        output = stdout.getvalue()
+        self.assertIn("Mensaje de commit propuesto", output)
+        self.assertIn(scenario['expected_message'], output)
     
-    @patch('subprocess.run')
-    @patch('commit_buddy.MessageGenerator')
-    @patch('builtins.input')
-    @patch('builtins.print')
-    def test_1_4_ejecutar_commit_confirmacion(self, mock_print, mock_input, mock_msg_gen_class, mock_subprocess):
+    def test_1_4_ejecutar_commit_confirmacion(self):
         """Test: WHEN el usuario confirma el mensaje THEN el sistema SHALL permitir ejecutar el commit directamente"""
-        scenario = TestScenarios.successful_workflow_scenario()
-        
-        # Setup mocks
-        mock_subprocess.side_effect = [
-            TestFixtures.create_mock_subprocess_response(resp) for resp in scenario['git_responses']
-        ]
-        
-        mock_msg_gen = Mock()
-        mock_msg_gen.generate_message.return_value = scenario['expected_message']
-        mock_msg_gen_class.return_value = mock_msg_gen
-        
-        mock_input.return_value = scenario['user_inputs'][0]  # 'y' to confirm
+        scenario = _SUCCESS_SCENARIO
         
-        # Execute
-        result = self.commit_buddy.handle_from_diff()
+        # The scenario's first user input is 'y' to confirm
+        with _workflow_patches(scenario) as (git_commands, mock_msg_gen, mock_input, stdout):
+            result = self.commit_buddy.handle_from_diff()
         
         # Verify commit was executed
         self.assertEqual(result, scenario['expected_exit_code'])
-        commit_call = ['git', 'commit', '-m', scenario['expected_message']]
-        self.assertTrue(any(call[0][0] == commit_call for call in mock_subprocess.call_args_list))
+        self.assertIn(('git', 'commit', '-m', scenario['expected_message']), git_commands)
 
 
 class TestRequirement2(unittest.TestCase):
     """Test Requirement 2: Conventional Commits format"""
     
-    def setUp(self):
-        self.config = TestFixtures.create_mock_config()
-        self.generator = MessageGenerator(self.config)
-    
-    def test_2_1_prefijo_feat(self):
-        """Test: WHEN la API genera un mensaje THEN el mensaje SHALL usar el prefijo "feat:" para nuevas funcionalidades"""
-        files = ['src/auth.py']
-        message = self.generator.generate_fallback_message(files)
-        self.assertTrue(message.startswith('feat:'), f"Message should start with 'feat:' but was: {message}")
-    
-    def test_2_2_prefijo_fix(self):
-        """Test: WHEN la API genera un mensaje THEN el mensaje SHALL usar el prefijo "fix:" para correcciones de bugs"""
-        # Test fix keyword detection
-        message = "fix login bug in authentication"
-        files = ['auth.py']
-        fixed = self.generator._fix_conventional_format(message, files)
-        self.assertTrue(fixed.startswith('fix:'), f"Message should start with 'fix:' but was: {fixed}")
+    # (criterion, AI message to fix or None for a fallback message, files, expected prefix)
+    PREFIX_CASES = [
+        ("2.1 feat: nuevas funcionalidades", None, ['src/auth.py'], 'feat:'),
+        ("2.2 fix: correcciones de bugs", "fix login bug in authentication", ['auth.py'], 'fix:'),
+        ("2.3 docs: cambios de documentación", None, ['README.md', 'docs/api.md'], 'docs:'),
+        ("2.4 refactor: refactorizaciones", "refactor code structure", ['main.py'], 'refactor:'),
+        ("2.5 test: cambios en pruebas", None, ['test_main.py', 'tests/test_utils.py'], 'test:'),
+        ("2.6 chore: cambios misceláneos", None, ['config.json', 'package.json'], 'chore:'),
+    ]
     
-    def test_2_3_prefijo_docs(self):
-        """Test: WHEN la API genera un mensaje THEN el mensaje SHALL usar el prefijo "docs:" para cambios de documentación"""
-        files = ['README.md', 'docs/api.md']
-        message = self.generator.generate_fallback_message(files)
-        self.assertTrue(message.startswith('docs:'), f"Message should start with 'docs:' but was: {message}")
+    @classmethod
+    def setUpClass(cls):
+        from message_generator import MessageGenerator
+        cls.config = TestFixtures.create_mock_config()
+        cls.generator = MessageGenerator(cls.config)
     
-    def test_2_4_prefijo_refactor(self):
-        """Test: WHEN la API genera un mensaje THEN el mensaje SHALL usar el prefijo "refactor:" para refactorizaciones"""
-        message = "refactor code structure"
-        files = ['main.py']
-        fixed = self.generator._fix_conventional_format(message, files)
-        self.assertTrue(fixed.startswith('refactor:'), f"Message should start with 'refactor:' but was: {fixed}")
-    
-    def test_2_5_prefijo_test(self):
-        """Test: WHEN la API genera un mensaje THEN el mensaje SHALL usar el prefijo "test:" para cambios en pruebas"""
-        files = ['test_main.py', 'tests/test_utils.py']
-        message = self.generator.generate_fallback_message(files)
-        self.assertTrue(message.startswith('test:'), f"Message should start with 'test:' but was: {message}")
-    
-    def test_2_6_prefijo_chore(self):
-        """Test: WHEN la API genera un mensaje THEN el mensaje SHALL usar el prefijo "chore:" para cambios misceláneos"""
-        files = ['config.json', 'package.json']
-        message = self.generator.generate_fallback_message(files)
-        self.assertTrue(message.startswith('chore:'), f"Message should start with 'chore:' but was: {message}")
+    def test_2_prefijos_conventional_commits(self):
+        """Test: WHEN la API genera un mensaje THEN el mensaje SHALL usar el prefijo adecuado al tipo de cambio"""
+        for criterion, message, files, prefix in self.PREFIX_CASES:
+            with self.subTest(criterion):
+                if message is None:
+                    result = self.generator.generate_fallback_message(files)
+                else:
+                    result = self.generator._fix_conventional_format(message, files)
+                self.assertTrue(result.startswith(prefix), f"Message should start with '{prefix}' but was: {result}")
 
 
 class TestRequirement3(unittest.TestCase):
     """Test Requirement 3: Fallback mechanisms"""
     
+    @classmethod
+    def setUpClass(cls):
+        from commit_buddy import CommitBuddy
+        from groq_client import GroqClient, GroqAPIError
+        from message_generator import MessageGenerator
+        cls.CommitBuddy = CommitBuddy
+        cls.MessageGenerator = MessageGenerator
+        cls.config = TestFixtures.create_mock_config()
+        cls.generator = MessageGenerator(cls.config)
+        
+        # Preconfigured Groq clients, spec'd so a misspelled method fails the test
+        cls.groq_unavailable = Mock(spec=GroqClient, **{
+            'is_api_available.return_value': False
+        })
+        cls.groq_network_error = Mock(spec=GroqClient, **{
+            'is_api_available.return_value': True,
+            'generate_commit_message.side_effect': GroqAPIError("Network error")
+        })
+    
     def setUp(self):
-        self.config = TestFixtures.create_mock_config()
-        self.generator = MessageGenerator(self.config)
+        # Clear call history between tests; configured return values are kept
+        self.groq_unavailable.reset_mock()
+        self.groq_network_error.reset_mock()
     
     @patch('message_generator.GroqClient')
     def test_3_1_api_no_disponible_fallback(self, mock_groq_class):
         """Test: WHEN la API de Groq no está disponible THEN el sistema SHALL generar un mensaje de fallback básico"""
         # Mock API unavailable
-        mock_groq = Mock()
-        mock_groq.is_api_available.return_value = False
-        mock_groq_class.return_value = mock_groq
+        mock_groq_class.return_value = self.groq_unavailable
         
-        generator = MessageGenerator(self.config)
+        generator = self.MessageGenerator(self.config)
         diff = TestFixtures.SAMPLE_DIFFS['python_feature']
         files = ['auth.py']
         
@@ -210,18 +216,15 @@ class TestRequirement3(unittest.TestCase):
         # Should generate fallback message
         self.assertTrue(message.startswith('feat:'))
         self.assertIn('auth.py', message)
-        mock_groq.generate_commit_message.assert_not_called()
+        self.groq_unavailable.generate_commit_message.assert_not_called()
     
     @patch('message_generator.GroqClient')
     def test_3_2_sin_conexion_formato_fallback(self, mock_groq_class):
         """Test: WHEN no hay conexión a internet THEN el sistema SHALL usar el formato "update files: [nombres de archivos]" """
         # Mock connection error
-        mock_groq = Mock()
-        mock_groq.is_api_available.return_value = True
-        mock_groq.generate_commit_message.side_effect = GroqAPIError("Connection error")
-        mock_groq_class.return_value = mock_groq
+        mock_groq_class.return_value = self.groq_network_error
         
-        generator = MessageGenerator(self.config)
+        generator = self.MessageGenerator(self.config)
         diff = TestFixtures.SAMPLE_DIFFS['python_feature']
         files = ['file1.py', 'file2.py']
         
@@ -231,44 +234,29 @@ class TestRequirement3(unittest.TestCase):
         self.assertIn('file1.py', message)
         self.assertIn('file2.py', message)
     
-    @patch('subprocess.run')
-    @patch('commit_buddy.MessageGenerator')
-    @patch('builtins.input')
-    @patch('builtins.print')
-    def test_3_3_api_error_informar_fallback(self, mock_print, mock_input, mock_msg_gen_class, mock_subprocess):
+    def test_3_3_api_error_informar_fallback(self):
         """Test: WHEN la API devuelve un error THEN el sistema SHALL informar al usuario y ofrecer el mensaje de fallback"""
-        scenario = TestScenarios.fallback_workflow_scenario()
+        scenario = _FALLBACK_SCENARIO
         
-        # Setup mocks
-        mock_subprocess.side_effect = [
-            TestFixtures.create_mock_subprocess_response(resp) for resp in scenario['git_responses']
-        ]
-        
-        mock_msg_gen = Mock()
-        mock_msg_gen.generate_message.side_effect = scenario['api_error']
-        mock_msg_gen.generate_fallback_message.return_value = scenario['expected_message']
-        mock_msg_gen_class.return_value = mock_msg_gen
-        
-        mock_input.return_value = scenario['user_inputs'][0]
-        
-        commit_buddy = CommitBuddy()
-        result = commit_buddy.handle_from_diff()
+        with _workflow_patches(scenario) as (git_commands, mock_msg_gen, mock_input, stdout):
+            mock_msg_gen.generate_message.side_effect = scenario['api_error']
+            mock_msg_gen.generate_fallback_message.return_value = scenario['expected_message']
+            
+            commit_buddy = self.CommitBuddy()
+            result = commit_buddy.handle_from_diff()
         
         # Verify error was reported and fallback was used
         self.assertEqual(result, scenario['expected_exit_code'])
-        self.assertTrue(any("Error generando mensaje" in str(call) for call in mock_print.call_args_list))
+        self.assertIn("Error generando mensaje", stdout.getvalue())
         mock_msg_gen.generate_fallback_message.assert_called_once()
     
     @patch('message_generator.GroqClient')
     def test_3_4_error_red_continuar_fallback(self, mock_groq_class):
         """Test: WHEN ocurre un error de red THEN el sistema SHALL continuar funcionando con el mecanismo de fallback"""
         # Mock network error
-        mock_groq = Mock()
-        mock_groq.is_api_available.return_value = True
-        mock_groq.generate_commit_message.side_effect = GroqAPIError("Network error")
-        mock_groq_class.return_value = mock_groq
+        mock_groq_class.return_value = self.groq_network_error
         
-        generator = MessageGenerator(self.config)
+        generator = self.MessageGenerator(self.config)
         diff = TestFixtures.SAMPLE_DIFFS['bug_fix']
         files = ['utils.py']
         
@@ -283,45 +271,50 @@ class TestRequirement3(unittest.TestCase):
 class TestRequirement4(unittest.TestCase):
     """Test Requirement 4: API key security"""
     
-    @patch.dict(os.environ, {'GROQ_API_KEY': 'test-api-key-123'})
+    @classmethod
+    def setUpClass(cls):
+        from config import Config
+        from groq_client import GroqClient, GroqAPIError
+        cls.GroqClient = GroqClient
+        cls.GroqAPIError = GroqAPIError
+        
+        # Config reads the environment when constructed, so build one per environment state
+        with patch.dict(os.environ, {'GROQ_API_KEY': 'test-api-key-123'}):
+            cls.config_with_key = Config()
+        with patch.dict(os.environ, {}, clear=True):
+            cls.config_without_key = Config()
+        with patch.dict(os.environ, {'GROQ_API_KEY': 'invalid-key'}):
+            cls.config_invalid_key = Config()
+    
     def test_4_1_leer_api_key_variable_entorno(self):
         """Test: WHEN el sistema necesita acceder a la API THEN el sistema SHALL leer la API key desde la variable de entorno"""
-        config = Config()
+        config = self.config_with_key
         self.assertTrue(config.has_groq_api_key())
         self.assertEqual(config.get_groq_api_key(), 'test-api-key-123')
     
-    @patch.dict(os.environ, {}, clear=True)
     def test_4_2_variable_no_configurada_error(self):
         """Test: WHEN la variable de entorno no está configurada THEN el sistema SHALL mostrar un mensaje de error claro"""
-        config = Config()
+        config = self.config_without_key
         self.assertFalse(config.has_groq_api_key())
         
-        with self.assertRaises(GroqAPIError) as context:
-            GroqClient(config)
+        with self.assertRaises(self.GroqAPIError) as context:
+            self.GroqClient(config)
         
         self.assertIn("GROQ_API_KEY environment variable is not configured", str(context.exception))
     
-    @patch('requests.post')
-    @patch.dict(os.environ, {'GROQ_API_KEY': 'invalid-key'})
+    @patch('requests.post', return_value=_UNAUTHORIZED_RESPONSE)
     def test_4_3_api_key_invalida_fallback(self, mock_post):
         """Test: WHEN la API key es inválida THEN el sistema SHALL informar al usuario y usar el mecanismo de fallback"""
-        # Mock invalid API key response
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_post.return_value = mock_response
-        
-        config = Config()
-        client = GroqClient(config)
+        client = self.GroqClient(self.config_invalid_key)
         
-        with self.assertRaises(GroqAPIError) as context:
+        with self.assertRaises(self.GroqAPIError) as context:
             client.generate_commit_message("test diff")
         
         self.assertIn("Invalid API key", str(context.exception))
     
-    @patch.dict(os.environ, {'GROQ_API_KEY': 'valid-key'})
     def test_4_4_api_key_configurada_modelo_correcto(self):
         """Test: IF la API key está configurada THEN el sistema SHALL usar el modelo `llama3-70b-8192`"""
-        config = Config()
+        config = self.config_with_key
         self.assertTrue(config.has_groq_api_key())
         self.assertEqual(config.GROQ_MODEL, "llama3-70b-8192")
 
@@ -329,6 +322,14 @@ class TestRequirement4(unittest.TestCase):
 class TestRequirement5(unittest.TestCase):
     """Test Requirement 5: Kiro integration"""
     
+    @classmethod
+    def setUpClass(cls):
+        from commit_buddy import CommitBuddy
+        from git_operations import GitOperations
+        # Neither object keeps state between calls, so the tests can share them
+        cls.commit_buddy = CommitBuddy()
+        cls.git_ops = GitOperations()
+    
     def test_5_1_comando_registrado_kiro(self):
         """Test: WHEN el usuario instala la herramienta THEN el comando SHALL estar registrado en `.kiro/spec.yml`"""
         # Check if Kiro hook files exist
@@ -337,72 +338,61 @@ class TestRequirement5(unittest.TestCase):
     
     def test_5_2_kiro_reconocer_comando(self):
         """Test: WHEN el usuario ejecuta `kiro commit --from-diff` THEN Kiro SHALL reconocer y ejecutar el comando"""
-        commit_buddy = CommitBuddy()
-        
         # Test that main method handles --from-diff argument
-        with patch.object(commit_buddy, 'handle_from_diff', return_value=0) as mock_handle:
-            result = commit_buddy.main(['--from-diff'])
+        with patch.object(self.commit_buddy, 'handle_from_diff', return_value=0) as mock_handle:
+            result = self.commit_buddy.main(['--from-diff'])
             self.assertEqual(result, 0)
             mock_handle.assert_called_once()
     
-    @patch('subprocess.run')
-    def test_5_3_funcionar_cualquier_directorio_git(self, mock_run):
+    def test_5_3_funcionar_cualquier_directorio_git(self):
         """Test: WHEN la herramienta se ejecuta THEN el sistema SHALL funcionar desde cualquier directorio dentro del repositorio Git"""
         # Mock valid git repository
-        mock_run.return_value = TestFixtures.create_mock_subprocess_response(
-            TestFixtures.GIT_RESPONSES['valid_repo']
-        )
+        valid_repo = TestFixtures.create_mock_subprocess_response(TestFixtures.GIT_RESPONSES['valid_repo'])
         
-        git_ops = GitOperations()
-        self.assertTrue(git_ops.is_git_repository())
+        with patch('subprocess.run', return_value=valid_repo):
+            self.assertTrue(self.git_ops.is_git_repository())
     
     def test_5_4_disponible_inmediatamente(self):
         """Test: WHEN el comando se registra THEN el sistema SHALL estar disponible inmediatamente sin reiniciar Kiro"""
         # Test that the CLI is immediately functional
-        commit_buddy = CommitBuddy()
-        
         # Should be able to show help without any setup
-        with patch('sys.stdout'):
-            result = commit_buddy.main([])
-            self.assertEqual(result, 0)
+        with redirect_stdout(io.StringIO()) as stdout:
+            result = self.commit_buddy.main([])
+        self.assertEqual(result, 0)
+        self.assertIn("--from-diff", stdout.getvalue())
 
 
 class TestRequirement6(unittest.TestCase):
     """Test Requirement 6: Documentation"""
     
+    @classmethod
+    def setUpClass(cls):
+        cls.readme = _read_doc(README_PATH)
+        cls.troubleshooting = _read_doc(TROUBLESHOOTING_PATH)
+    
     def test_6_1_readme_instrucciones_instalacion(self):
         """Test: WHEN el usuario accede al README THEN el documento SHALL incluir instrucciones de instalación paso a paso"""
-        readme_path = Path(__file__).parent.parent.parent / "README.md"
-        self.assertTrue(readme_path.exists(), "README.md should exist")
+        self.assertIsNotNone(self.readme, "README.md should exist")
         
-        if readme_path.exists():
-            content = readme_path.read_text()
-            self.assertIn("instalación", content.lower(), "README should contain installation instructions")
+        if self.readme is not None:
+            self.assertIn("instalación", self.readme.lower(), "README should contain installation instructions")
     
     def test_6_2_documentacion_groq_api_key(self):
         """Test: WHEN el usuario lee la documentación THEN el documento SHALL explicar cómo configurar `GROQ_API_KEY`"""
-        readme_path = Path(__file__).parent.parent.parent / "README.md"
-        
-        if readme_path.exists():
-            content = readme_path.read_text()
-            self.assertIn("GROQ_API_KEY", content, "README should mention GROQ_API_KEY configuration")
+        if self.readme is not None:
+            self.assertIn("GROQ_API_KEY", self.readme, "README should mention GROQ_API_KEY configuration")
     
     def test_6_3_ejemplos_uso_comun(self):
         """Test: WHEN el usuario consulta ejemplos THEN el documento SHALL mostrar casos de uso comunes con `kiro commit --from-diff`"""
-        readme_path = Path(__file__).parent.parent.parent / "README.md"
-        
-        if readme_path.exists():
-            content = readme_path.read_text()
-            self.assertIn("--from-diff", content, "README should show --from-diff usage examples")
+        if self.readme is not None:
+            self.assertIn("--from-diff", self.readme, "README should show --from-diff usage examples")
     
     def test_6_4_troubleshooting_problemas_comunes(self):
         """Test: WHEN el usuario necesita troubleshooting THEN el documento SHALL incluir soluciones para problemas comunes"""
-        troubleshooting_path = Path(__file__).parent.parent.parent / "TROUBLESHOOTING.md"
-        self.assertTrue(troubleshooting_path.exists(), "TROUBLESHOOTING.md should exist")
+        self.assertIsNotNone(self.troubleshooting, "TROUBLESHOOTING.md should exist")
         
-        if troubleshooting_path.exists():
-            content = troubleshooting_path.read_text()
-            self.assertIn("problema", content.lower(), "TROUBLESHOOTING should contain problem solutions")
+        if self.troubleshooting is not None:
+            self.assertIn("problema", self.troubleshooting.lower(), "TROUBLESHOOTING should contain problem solutions")
 
 
 if __name__ == '__main__':
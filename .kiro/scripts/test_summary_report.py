@@ -5,272 +5,279 @@ Provides a complete overview of test coverage and validation
 """
 
 import sys
-import os
-from pathlib import Path
 
-# Add the scripts directory to Python path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Static report content, built once at import rather than on every call
+
+# Test files created
+_TEST_FILES = (
+    "test_comprehensive_suite.py - Main test suite runner",
+    "test_fixtures.py - Test data and fixtures",
+    "test_requirements_validation.py - Requirements validation tests",
+    "test_performance.py - Performance and stress tests",
+    "test_core_functionality.py - Core functionality validation",
+    "run_all_tests.py - Complete test runner with reporting",
+    "test_summary_report.py - This summary report"
+)
+
+# Existing test files enhanced
+_EXISTING_TESTS = (
+    "test_git_operations.py - Git operations unit tests",
+    "test_groq_client.py - Groq API client unit tests", 
+    "test_message_generator.py - Message generator unit tests",
+    "test_user_interface.py - User interface unit tests",
+    "test_config.py - Configuration tests",
+    "test_error_handling.py - Error handling tests",
+    "test_commit_buddy_integration.py - Integration tests",
+    "test_e2e_workflow.py - End-to-end workflow tests"
+)
+
+# Test categories implemented
+_TEST_CATEGORIES = (
+    ("Unit Tests", (
+        "✅ Git Operations - All Git commands and error handling",
+        "✅ Groq API Client - API communication and error handling", 
+        "✅ Message Generator - AI and fallback message generation",
+        "✅ User Interface - User interaction and display",
+        "✅ Configuration - Environment and API key handling"
+    )),
+    ("Integration Tests", (
+        "✅ Component Interactions - How components work together",
+        "✅ CLI Argument Parsing - Command line interface",
+        "✅ Workflow Orchestration - Complete process flow",
+        "✅ Error Propagation - Error handling across components"
+    )),
+    ("End-to-End Tests", (
+        "✅ Complete Workflows - Full user scenarios",
+        "✅ Success Scenarios - Happy path testing",
+        "✅ Fallback Scenarios - API failure handling",
+        "✅ User Interaction - Confirmation and editing flows"
+    )),
+    ("Error Handling Tests", (
+        "✅ Git Repository Validation - Invalid repo handling",
+        "✅ No Staged Changes - Empty diff handling",
+        "✅ API Failures - Network and authentication errors",
+        "✅ Configuration Errors - Missing API keys",
+        "✅ User Cancellation - Interrupt handling"
+    )),
+    ("Performance Tests", (
+        "✅ Large Diff Handling - Performance with big changes",
+        "✅ Many Files - Handling numerous file changes",
+        "✅ Concurrent Operations - Thread safety",
+        "✅ Memory Usage - Resource management",
+        "✅ Edge Cases - Boundary conditions"
+    )),
+    ("Requirements Validation", (
+        "✅ Requirement 1 - CLI workflow functionality",
+        "✅ Requirement 2 - Conventional Commits format",
+        "✅ Requirement 3 - Fallback mechanisms",
+        "✅ Requirement 4 - API key security",
+        "✅ Requirement 5 - Kiro integration",
+        "✅ Requirement 6 - Documentation"
+    ))
+)
+
+# Mock strategies implemented
+_MOCK_STRATEGIES = (
+    "✅ External Dependencies - subprocess, requests, file system",
+    "✅ User Input - input() function mocking",
+    "✅ Environment Variables - os.environ mocking",
+    "✅ API Responses - HTTP response mocking",
+    "✅ Git Commands - subprocess.run mocking",
+    "✅ File Operations - Path and file system mocking"
+)
+
+# Test fixtures and data
+_FIXTURES = (
+    "✅ Sample Git Diffs - Various types of code changes",
+    "✅ File Lists - Different file combinations",
+    "✅ API Responses - Success and error scenarios",
+    "✅ Git Command Responses - Various Git states",
+    "✅ Mock Configurations - Different config scenarios",
+    "✅ Test Scenarios - Complete workflow scenarios",
+    "✅ Edge Case Data - Boundary and stress test data"
+)
+
+# Requirements coverage
+_REQUIREMENTS_COVERAGE = (
+    ("Requirement 1 - CLI Workflow", (
+        ("1.1", "✅ Obtener diff actual del repositorio Git"),
+        ("1.2", "✅ Enviar contenido a la API de Groq"),
+        ("1.3", "✅ Mostrar mensaje al usuario para confirmación"),
+        ("1.4", "✅ Ejecutar commit directamente con mensaje confirmado")
+    )),
+    ("Requirement 2 - Conventional Commits", (
+        ("2.1", "✅ Prefijo 'feat:' para nuevas funcionalidades"),
+        ("2.2", "✅ Prefijo 'fix:' para correcciones de bugs"),
+        ("2.3", "✅ Prefijo 'docs:' para cambios de documentación"),
+        ("2.4", "✅ Prefijo 'refactor:' para refactorizaciones"),
+        ("2.5", "✅ Prefijo 'test:' para cambios en pruebas"),
+        ("2.6", "✅ Prefijo 'chore:' para cambios misceláneos")
+    )),
+    ("Requirement 3 - Fallback Mechanisms", (
+        ("3.1", "✅ Generar mensaje de fallback cuando API no disponible"),
+        ("3.2", "✅ Usar formato fallback sin conexión a internet"),
+        ("3.3", "✅ Informar al usuario y ofrecer fallback en errores"),
+        ("3.4", "✅ Continuar funcionando con mecanismo de fallback")
+    )),
+    ("Requirement 4 - API Key Security", (
+        ("4.1", "✅ Leer API key desde variable de entorno GROQ_API_KEY"),
+        ("4.2", "✅ Mostrar mensaje de error claro si no configurada"),
+        ("4.3", "✅ Informar al usuario y usar fallback si inválida"),
+        ("4.4", "✅ Usar modelo llama3-70b-8192 si configurada")
+    )),
+    ("Requirement 5 - Kiro Integration", (
+        ("5.1", "✅ Comando registrado en estructura Kiro"),
+        ("5.2", "✅ Kiro reconoce y ejecuta comando"),
+        ("5.3", "✅ Funciona desde cualquier directorio Git"),
+        ("5.4", "✅ Disponible inmediatamente sin reiniciar")
+    )),
+    ("Requirement 6 - Documentation", (
+        ("6.1", "✅ README incluye instrucciones de instalación"),
+        ("6.2", "✅ Documentación explica configuración GROQ_API_KEY"),
+        ("6.3", "✅ Ejemplos muestran casos de uso comunes"),
+        ("6.4", "✅ Troubleshooting incluye soluciones problemas")
+    ))
+)
+
+# Test execution capabilities
+_EXECUTION_CAPABILITIES = (
+    "✅ Individual test module execution",
+    "✅ Comprehensive test suite execution", 
+    "✅ Core functionality validation",
+    "✅ Performance and stress testing",
+    "✅ Requirements validation testing",
+    "✅ Detailed reporting and metrics",
+    "✅ Failure analysis and debugging",
+    "✅ Coverage reporting (when available)"
+)
+
+# Implementation quality
+_QUALITY_ASPECTS = (
+    "✅ Comprehensive Coverage - All components tested",
+    "✅ Realistic Scenarios - Real-world usage patterns",
+    "✅ Error Handling - All failure modes covered",
+    "✅ Performance Testing - Stress and edge cases",
+    "✅ Mock Strategies - External dependencies isolated",
+    "✅ Test Fixtures - Consistent and reusable data",
+    "✅ Requirements Validation - All acceptance criteria tested",
+    "✅ Documentation - Clear test structure and purpose"
+)
+
+# Recommendations for production
+_RECOMMENDATIONS = (
+    "✅ Run core functionality tests before deployment",
+    "✅ Execute performance tests under load",
+    "✅ Validate all requirements before release",
+    "✅ Monitor test coverage metrics",
+    "✅ Update tests when adding new features",
+    "✅ Use test fixtures for consistent testing",
+    "✅ Maintain mock strategies for reliability",
+    "✅ Document test scenarios for team knowledge"
+)
 
 
 def generate_test_summary():
     """Generate comprehensive test summary"""
     
-    print("=" * 80)
-    print("KIRO COMMIT BUDDY - COMPREHENSIVE TEST IMPLEMENTATION SUMMARY")
-    print("=" * 80)
-    print()
-    
-    # Test files created
-    test_files = [
-        "test_comprehensive_suite.py - Main test suite runner",
-        "test_fixtures.py - Test data and fixtures",
-        "test_requirements_validation.py - Requirements validation tests",
-        "test_performance.py - Performance and stress tests",
-        "test_core_functionality.py - Core functionality validation",
-        "run_all_tests.py - Complete test runner with reporting",
-        "test_summary_report.py - This summary report"
-    ]
+    # Collect the report and write it in one go instead of one print per line
+    lines = []
+    out = lines.append
     
-    print("📁 TEST FILES CREATED:")
-    print("-" * 40)
-    for test_file in test_files:
-        print(f"  ✅ {test_file}")
-    print()
+    out("=" * 80)
+    out("KIRO COMMIT BUDDY - COMPREHENSIVE TEST IMPLEMENTATION SUMMARY")
+    out("=" * 80)
+    out("")
     
-    # Existing test files enhanced
-    existing_tests = [
-        "test_git_operations.py - Git operations unit tests",
-        "test_groq_client.py - Groq API client unit tests", 
-        "test_message_generator.py - Message generator unit tests",
-        "test_user_interface.py - User interface unit tests",
-        "test_config.py - Configuration tests",
-        "test_error_handling.py - Error handling tests",
-        "test_commit_buddy_integration.py - Integration tests",
-        "test_e2e_workflow.py - End-to-end workflow tests"
-    ]
+    out("📁 TEST FILES CREATED:")
+    out("-" * 40)
+    for test_file in _TEST_FILES:
+        out(f"  ✅ {test_file}")
+    out("")
     
-    print("📋 EXISTING TEST FILES ENHANCED:")
-    print("-" * 40)
-    for test_file in existing_tests:
-        print(f"  ✅ {test_file}")
-    print()
+    out("📋 EXISTING TEST FILES ENHANCED:")
+    out("-" * 40)
+    for test_file in _EXISTING_TESTS:
+        out(f"  ✅ {test_file}")
+    out("")
     
-    # Test categories implemented
-    test_categories = {
-        "Unit Tests": [
-            "✅ Git Operations - All Git commands and error handling",
-            "✅ Groq API Client - API communication and error handling", 
-            "✅ Message Generator - AI and fallback message generation",
-            "✅ User Interface - User interaction and display",
-            "✅ Configuration - Environment and API key handling"
-        ],
-        "Integration Tests": [
-            "✅ Component Interactions - How components work together",
-            "✅ CLI Argument Parsing - Command line interface",
-            "✅ Workflow Orchestration - Complete process flow",
-            "✅ Error Propagation - Error handling across components"
-        ],
-        "End-to-End Tests": [
-            "✅ Complete Workflows - Full user scenarios",
-            "✅ Success Scenarios - Happy path testing",
-            "✅ Fallback Scenarios - API failure handling",
-            "✅ User Interaction - Confirmation and editing flows"
-        ],
-        "Error Handling Tests": [
-            "✅ Git Repository Validation - Invalid repo handling",
-            "✅ No Staged Changes - Empty diff handling",
-            "✅ API Failures - Network and authentication errors",
-            "✅ Configuration Errors - Missing API keys",
-            "✅ User Cancellation - Interrupt handling"
-        ],
-        "Performance Tests": [
-            "✅ Large Diff Handling - Performance with big changes",
-            "✅ Many Files - Handling numerous file changes",
-            "✅ Concurrent Operations - Thread safety",
-            "✅ Memory Usage - Resource management",
-            "✅ Edge Cases - Boundary conditions"
-        ],
-        "Requirements Validation": [
-            "✅ Requirement 1 - CLI workflow functionality",
-            "✅ Requirement 2 - Conventional Commits format",
-            "✅ Requirement 3 - Fallback mechanisms",
-            "✅ Requirement 4 - API key security",
-            "✅ Requirement 5 - Kiro integration",
-            "✅ Requirement 6 - Documentation"
-        ]
-    }
-    
-    print("🧪 TEST CATEGORIES IMPLEMENTED:")
-    print("-" * 40)
-    for category, tests in test_categories.items():
-        print(f"\n{category}:")
+    out("🧪 TEST CATEGORIES IMPLEMENTED:")
+    out("-" * 40)
+    for category, tests in _TEST_CATEGORIES:
+        out(f"\n{category}:")
         for test in tests:
-            print(f"  {test}")
-    print()
-    
-    # Mock strategies implemented
-    mock_strategies = [
-        "✅ External Dependencies - subprocess, requests, file system",
-        "✅ User Input - input() function mocking",
-        "✅ Environment Variables - os.environ mocking",
-        "✅ API Responses - HTTP response mocking",
-        "✅ Git Commands - subprocess.run mocking",
-        "✅ File Operations - Path and file system mocking"
-    ]
+            out(f"  {test}")
+    out("")
     
-    print("🎭 MOCK STRATEGIES IMPLEMENTED:")
-    print("-" * 40)
-    for strategy in mock_strategies:
-        print(f"  {strategy}")
-    print()
+    out("🎭 MOCK STRATEGIES IMPLEMENTED:")
+    out("-" * 40)
+    for strategy in _MOCK_STRATEGIES:
+        out(f"  {strategy}")
+    out("")
     
-    # Test fixtures and data
-    fixtures = [
-        "✅ Sample Git Diffs - Various types of code changes",
-        "✅ File Lists - Different file combinations",
-        "✅ API Responses - Success and error scenarios",
-        "✅ Git Command Responses - Various Git states",
-        "✅ Mock Configurations - Different config scenarios",
-        "✅ Test Scenarios - Complete workflow scenarios",
-        "✅ Edge Case Data - Boundary and stress test data"
-    ]
+    out("📊 TEST FIXTURES AND DATA:")
+    out("-" * 40)
+    for fixture in _FIXTURES:
+        out(f"  {fixture}")
+    out("")
     
-    print("📊 TEST FIXTURES AND DATA:")
-    print("-" * 40)
-    for fixture in fixtures:
-        print(f"  {fixture}")
-    print()
-    
-    # Requirements coverage
-    requirements_coverage = {
-        "Requirement 1 - CLI Workflow": {
-            "1.1": "✅ Obtener diff actual del repositorio Git",
-            "1.2": "✅ Enviar contenido a la API de Groq",
-            "1.3": "✅ Mostrar mensaje al usuario para confirmación",
-            "1.4": "✅ Ejecutar commit directamente con mensaje confirmado"
-        },
-        "Requirement 2 - Conventional Commits": {
-            "2.1": "✅ Prefijo 'feat:' para nuevas funcionalidades",
-            "2.2": "✅ Prefijo 'fix:' para correcciones de bugs",
-            "2.3": "✅ Prefijo 'docs:' para cambios de documentación",
-            "2.4": "✅ Prefijo 'refactor:' para refactorizaciones",
-            "2.5": "✅ Prefijo 'test:' para cambios en pruebas",
-            "2.6": "✅ Prefijo 'chore:' para cambios misceláneos"
-        },
-        "Requirement 3 - Fallback Mechanisms": {
-            "3.1": "✅ Generar mensaje de fallback cuando API no disponible",
-            "3.2": "✅ Usar formato fallback sin conexión a internet",
-            "3.3": "✅ Informar al usuario y ofrecer fallback en errores",
-            "3.4": "✅ Continuar funcionando con mecanismo de fallback"
-        },
-        "Requirement 4 - API Key Security": {
-            "4.1": "✅ Leer API key desde variable de entorno GROQ_API_KEY",
-            "4.2": "✅ Mostrar mensaje de error claro si no configurada",
-            "4.3": "✅ Informar al usuario y usar fallback si inválida",
-            "4.4": "✅ Usar modelo llama3-70b-8192 si configurada"
-        },
-        "Requirement 5 - Kiro Integration": {
-            "5.1": "✅ Comando registrado en estructura Kiro",
-            "5.2": "✅ Kiro reconoce y ejecuta comando",
-            "5.3": "✅ Funciona desde cualquier directorio Git",
-            "5.4": "✅ Disponible inmediatamente sin reiniciar"
-        },
-        "Requirement 6 - Documentation": {
-            "6.1": "✅ README incluye instrucciones de instalación",
-            "6.2": "✅ Documentación explica configuración GROQ_API_KEY",
-            "6.3": "✅ Ejemplos muestran casos de uso comunes",
-            "6.4": "✅ Troubleshooting incluye soluciones problemas"
-        }
-    }
-    
-    print("📋 REQUIREMENTS COVERAGE VALIDATION:")
-    print("-" * 40)
-    for requirement, criteria in requirements_coverage.items():
-        print(f"\n{requirement}:")
-        for criterion_id, description in criteria.items():
-            print(f"  {criterion_id}: {description}")
-    print()
+    out("📋 REQUIREMENTS COVERAGE VALIDATION:")
+    out("-" * 40)
+    for requirement, criteria in _REQUIREMENTS_COVERAGE:
+        out(f"\n{requirement}:")
+        for criterion_id, description in criteria:
+            out(f"  {criterion_id}: {description}")
+    out("")
     
     # Test execution summary
-    print("🚀 TEST EXECUTION CAPABILITIES:")
-    print("-" * 40)
-    execution_capabilities = [
-        "✅ Individual test module execution",
-        "✅ Comprehensive test suite execution", 
-        "✅ Core functionality validation",
-        "✅ Performance and stress testing",
-        "✅ Requirements validation testing",
-        "✅ Detailed reporting and metrics",
-        "✅ Failure analysis and debugging",
-        "✅ Coverage reporting (when available)"
-    ]
-    
-    for capability in execution_capabilities:
-        print(f"  {capability}")
-    print()
+    out("🚀 TEST EXECUTION CAPABILITIES:")
+    out("-" * 40)
+    for capability in _EXECUTION_CAPABILITIES:
+        out(f"  {capability}")
+    out("")
     
     # Success metrics
-    print("📈 SUCCESS METRICS:")
-    print("-" * 40)
-    print("  ✅ Core Functionality Tests: 15/15 PASSED (100%)")
-    print("  ✅ Requirements Coverage: 6/6 requirements validated")
-    print("  ✅ Test Categories: 6/6 categories implemented")
-    print("  ✅ Mock Strategies: 6/6 strategies implemented")
-    print("  ✅ Test Fixtures: 7/7 fixture types created")
-    print("  ✅ Error Scenarios: All critical paths covered")
-    print()
+    out("📈 SUCCESS METRICS:")
+    out("-" * 40)
+    out("  ✅ Core Functionality Tests: 15/15 PASSED (100%)")
+    out("  ✅ Requirements Coverage: 6/6 requirements validated")
+    out("  ✅ Test Categories: 6/6 categories implemented")
+    out("  ✅ Mock Strategies: 6/6 strategies implemented")
+    out("  ✅ Test Fixtures: 7/7 fixture types created")
+    out("  ✅ Error Scenarios: All critical paths covered")
+    out("")
     
     # Implementation quality
-    print("🏆 IMPLEMENTATION QUALITY:")
-    print("-" * 40)
-    quality_aspects = [
-        "✅ Comprehensive Coverage - All components tested",
-        "✅ Realistic Scenarios - Real-world usage patterns",
-        "✅ Error Handling - All failure modes covered",
-        "✅ Performance Testing - Stress and edge cases",
-        "✅ Mock Strategies - External dependencies isolated",
-        "✅ Test Fixtures - Consistent and reusable data",
-        "✅ Requirements Validation - All acceptance criteria tested",
-        "✅ Documentation - Clear test structure and purpose"
-    ]
-    
-    for aspect in quality_aspects:
-        print(f"  {aspect}")
-    print()
+    out("🏆 IMPLEMENTATION QUALITY:")
+    out("-" * 40)
+    for aspect in _QUALITY_ASPECTS:
+        out(f"  {aspect}")
+    out("")
     
     # Recommendations
-    print("💡 RECOMMENDATIONS FOR PRODUCTION:")
-    print("-" * 40)
-    recommendations = [
-        "✅ Run core functionality tests before deployment",
-        "✅ Execute performance tests under load",
-        "✅ Validate all requirements before release",
-        "✅ Monitor test coverage metrics",
-        "✅ Update tests when adding new features",
-        "✅ Use test fixtures for consistent testing",
-        "✅ Maintain mock strategies for reliability",
-        "✅ Document test scenarios for team knowledge"
-    ]
+    out("💡 RECOMMENDATIONS FOR PRODUCTION:")
+    out("-" * 40)
+    for recommendation in _RECOMMENDATIONS:
+        out(f"  {recommendation}")
+    out("")
     
-    for recommendation in recommendations:
-        print(f"  {recommendation}")
-    print()
+    out("=" * 80)
+    out("🎉 COMPREHENSIVE TEST IMPLEMENTATION COMPLETED SUCCESSFULLY!")
+    out("=" * 80)
+    out("")
+    out("The Kiro Commit Buddy project now has:")
+    out("• Complete test coverage for all components")
+    out("• Validation of all requirements and acceptance criteria")
+    out("• Comprehensive error handling and edge case testing")
+    out("• Performance and stress testing capabilities")
+    out("• Realistic mock strategies for external dependencies")
+    out("• Consistent test fixtures and data")
+    out("• Multiple test execution options and detailed reporting")
+    out("")
+    out("✅ READY FOR PRODUCTION DEPLOYMENT")
+    out("=" * 80)
     
-    print("=" * 80)
-    print("🎉 COMPREHENSIVE TEST IMPLEMENTATION COMPLETED SUCCESSFULLY!")
-    print("=" * 80)
-    print()
-    print("The Kiro Commit Buddy project now has:")
-    print("• Complete test coverage for all components")
-    print("• Validation of all requirements and acceptance criteria")
-    print("• Comprehensive error handling and edge case testing")
-    print("• Performance and stress testing capabilities")
-    print("• Realistic mock strategies for external dependencies")
-    print("• Consistent test fixtures and data")
-    print("• Multiple test execution options and detailed reporting")
-    print()
-    print("✅ READY FOR PRODUCTION DEPLOYMENT")
-    print("=" * 80)
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 if __name__ == '__main__':
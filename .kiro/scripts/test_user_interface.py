@@ -7,15 +7,39 @@ import unittest
 from unittest.mock import patch, MagicMock
 import sys
 import io
+import user_interface
 from user_interface import UserInterface
 
 
+def _answers(*answers):
+    """Patch builtins.input with a plain function replaying answers (or raising them) in order.
+
+    Cheaper than a MagicMock; a fresh replay is built each time the patch starts.
+    """
+    def make_input():
+        replies = iter(answers)
+        
+        def fake_input(prompt=""):
+            reply = next(replies)
+            if isinstance(reply, BaseException):
+                raise reply
+            return reply
+        return fake_input
+    return patch('builtins.input', new_callable=make_input)
+
+
 class TestUserInterface(unittest.TestCase):
     """Test cases for UserInterface class"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up a UserInterface shared by all tests"""
+        cls.ui = UserInterface()
+        cls.default_colors_enabled = cls.ui.colors_enabled
+    
     def setUp(self):
-        """Set up test fixtures"""
-        self.ui = UserInterface()
+        """Restore the display settings some tests toggle"""
+        self.ui.colors_enabled = self.default_colors_enabled
     
     def test_init_colors_disabled_when_not_tty(self):
         """Test that colors are disabled when not in a TTY"""
@@ -39,18 +63,39 @@ class TestUserInterface(unittest.TestCase):
                     mock_fore.RED = '\033[31m'
                     mock_style.BRIGHT = '\033[1m'
                     mock_style.RESET_ALL = '\033[0m'
-                    
-                    result = self.ui._colorize("test", mock_fore.RED, mock_style.BRIGHT)
+                    # _colorize reads the reset from _RESET and caches sequences in _ANSI_TABLE
+                    with patch('user_interface._RESET', mock_style.RESET_ALL), \
+                            patch.dict(user_interface._ANSI_TABLE, clear=True):
+                        result = self.ui._colorize("test", mock_fore.RED, mock_style.BRIGHT)
                     expected = f"{mock_style.BRIGHT}{mock_fore.RED}test{mock_style.RESET_ALL}"
                     self.assertEqual(result, expected)
     
+    def test_loading_colorama_clears_cached_sequences(self):
+        """Test sequences cached before colorama is loaded are rebuilt with its reset"""
+        self.ui.colors_enabled = True
+        fake_colorama = MagicMock()
+        fake_colorama.Style.RESET_ALL = '\033[0m'
+        with patch.dict(sys.modules, {'colorama': fake_colorama}), \
+                patch.dict(user_interface._ANSI_TABLE, {('red', ''): ('red', '')}, clear=True), \
+                patch.multiple('user_interface', _colorama_loaded=False, _RESET='',
+                               Fore=user_interface.Fore, Style=user_interface.Style,
+                               Back=user_interface.Back):
+            user_interface._ensure_colorama()
+            self.assertNotIn(('red', ''), user_interface._ANSI_TABLE)
+            self.assertEqual(self.ui._colorize("test", 'red'), 'redtest\033[0m')
+    
+    def test_colorize_without_color_or_style(self):
+        """Test colorize emits no ANSI sequences when neither color nor style is given"""
+        self.ui.colors_enabled = True
+        self.assertEqual(self.ui._colorize("test"), "test")
+    
     def test_colorize_with_colors_disabled(self):
         """Test colorize method when colors are disabled"""
         self.ui.colors_enabled = False
         result = self.ui._colorize("test", "color", "style")
         self.assertEqual(result, "test")
     
-    @patch('builtins.input', return_value='y')
+    @_answers('y')
     @patch('sys.stdout', new_callable=io.StringIO)
     def test_show_proposed_message_accept(self, mock_stdout, mock_input):
         """Test show_proposed_message with user accepting"""
@@ -60,28 +105,42 @@ class TestUserInterface(unittest.TestCase):
         self.assertIn("Mensaje de commit propuesto", output)
         self.assertIn("feat: add new feature", output)
     
-    @patch('builtins.input', return_value='n')
+    @_answers('n')
     @patch('sys.stdout', new_callable=io.StringIO)
     def test_show_proposed_message_reject(self, mock_stdout, mock_input):
         """Test show_proposed_message with user rejecting"""
         result = self.ui.show_proposed_message("feat: add new feature")
         self.assertEqual(result, 'n')
     
-    @patch('builtins.input', return_value='e')
+    @_answers('e')
     @patch('sys.stdout', new_callable=io.StringIO)
     def test_show_proposed_message_edit(self, mock_stdout, mock_input):
         """Test show_proposed_message with user choosing to edit"""
         result = self.ui.show_proposed_message("feat: add new feature")
         self.assertEqual(result, 'e')
     
-    @patch('builtins.input', return_value='')
+    @_answers('  Edit ')
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_show_proposed_message_full_word_answer(self, mock_stdout, mock_input):
+        """Test show_proposed_message accepts padded full-word answers in any case"""
+        result = self.ui.show_proposed_message("feat: add new feature")
+        self.assertEqual(result, 'e')
+    
+    @_answers('yolo', 'everything', 'no')
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_show_proposed_message_reprompts_on_other_words(self, mock_stdout, mock_input):
+        """Test show_proposed_message re-prompts for words that merely start with y/n/e"""
+        result = self.ui.show_proposed_message("feat: add new feature")
+        self.assertEqual(result, 'n')
+    
+    @_answers('')
     @patch('sys.stdout', new_callable=io.StringIO)
     def test_show_proposed_message_default_accept(self, mock_stdout, mock_input):
         """Test show_proposed_message with empty input (default accept)"""
         result = self.ui.show_proposed_message("feat: add new feature")
         self.assertEqual(result, 'y')
     
-    @patch('builtins.input', side_effect=['invalid', 'y'])
+    @_answers('invalid', 'y')
     @patch('sys.stdout', new_callable=io.StringIO)
     def test_show_proposed_message_invalid_then_valid(self, mock_stdout, mock_input):
         """Test show_proposed_message with invalid input then valid"""
@@ -90,14 +149,14 @@ class TestUserInterface(unittest.TestCase):
         output = mock_stdout.getvalue()
         self.assertIn("Por favor ingresa", output)
     
-    @patch('builtins.input', side_effect=KeyboardInterrupt())
+    @_answers(KeyboardInterrupt())
     @patch('sys.stdout', new_callable=io.StringIO)
     def test_show_proposed_message_keyboard_interrupt(self, mock_stdout, mock_input):
         """Test show_proposed_message with keyboard interrupt"""
         result = self.ui.show_proposed_message("feat: add new feature")
         self.assertEqual(result, 'n')
     
-    @patch('builtins.input', side_effect=['fix: updated functionality', ''])
+    @_answers('fix: updated functionality', '')
     @patch('sys.stdout', new_callable=io.StringIO)
     def test_allow_message_editing_success(self, mock_stdout, mock_input):
         """Test allow_message_editing with successful edit"""
@@ -107,7 +166,7 @@ class TestUserInterface(unittest.TestCase):
         self.assertIn("Editando mensaje de commit", output)
         self.assertIn("feat: original message", output)
     
-    @patch('builtins.input', side_effect=['', ''])
+    @_answers('', '')
     @patch('sys.stdout', new_callable=io.StringIO)
     def test_allow_message_editing_empty_message(self, mock_stdout, mock_input):
         """Test allow_message_editing with empty message returns original"""
@@ -117,7 +176,7 @@ class TestUserInterface(unittest.TestCase):
         output = mock_stdout.getvalue()
         self.assertIn("Mensaje vacío, usando mensaje original", output)
     
-    @patch('builtins.input', side_effect=KeyboardInterrupt())
+    @_answers(KeyboardInterrupt())
     @patch('sys.stdout', new_callable=io.StringIO)
     def test_allow_message_editing_cancelled(self, mock_stdout, mock_input):
         """Test allow_message_editing with cancellation"""
@@ -126,7 +185,7 @@ class TestUserInterface(unittest.TestCase):
         output = mock_stdout.getvalue()
         self.assertIn("Edición cancelada", output)
     
-    @patch('builtins.input', side_effect=['line 1', 'line 2', ''])
+    @_answers('line 1', 'line 2', '')
     @patch('sys.stdout', new_callable=io.StringIO)
     def test_allow_message_editing_multiline(self, mock_stdout, mock_input):
         """Test allow_message_editing with multiline input"""
@@ -189,31 +248,37 @@ class TestUserInterface(unittest.TestCase):
         output = mock_stdout.getvalue()
         self.assertEqual(output, "")
     
-    @patch('builtins.input', return_value='y')
+    @_answers('y')
     def test_confirm_action_yes(self, mock_input):
         """Test confirm_action with yes response"""
         result = self.ui.confirm_action("Continue?")
         self.assertTrue(result)
     
-    @patch('builtins.input', return_value='n')
+    @_answers('n')
     def test_confirm_action_no(self, mock_input):
         """Test confirm_action with no response"""
         result = self.ui.confirm_action("Continue?")
         self.assertFalse(result)
     
-    @patch('builtins.input', return_value='')
+    @_answers('')
     def test_confirm_action_default_true(self, mock_input):
         """Test confirm_action with empty input and default True"""
         result = self.ui.confirm_action("Continue?", default=True)
         self.assertTrue(result)
     
-    @patch('builtins.input', return_value='')
+    @_answers('')
     def test_confirm_action_default_false(self, mock_input):
         """Test confirm_action with empty input and default False"""
         result = self.ui.confirm_action("Continue?", default=False)
         self.assertFalse(result)
     
-    @patch('builtins.input', side_effect=KeyboardInterrupt())
+    @_answers('yolo')
+    def test_confirm_action_other_word_is_not_confirmation(self, mock_input):
+        """Test confirm_action only treats y/yes as confirmation"""
+        result = self.ui.confirm_action("Continue?", default=True)
+        self.assertFalse(result)
+    
+    @_answers(KeyboardInterrupt())
     def test_confirm_action_keyboard_interrupt(self, mock_input):
         """Test confirm_action with keyboard interrupt"""
         result = self.ui.confirm_action("Continue?")
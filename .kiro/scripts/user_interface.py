@@ -5,74 +5,174 @@ Handles all user interactions and display formatting
 
 import sys
 import os
-from typing import Optional
-try:
-    from colorama import init, Fore, Style, Back
-    init(autoreset=True)  # Initialize colorama for cross-platform color support
-    COLORS_AVAILABLE = True
-except ImportError:
-    # Fallback if colorama is not available
-    COLORS_AVAILABLE = False
-    class Fore:
-        RED = GREEN = YELLOW = BLUE = CYAN = MAGENTA = WHITE = ""
-    class Style:
-        BRIGHT = DIM = RESET_ALL = ""
-    class Back:
-        RED = GREEN = YELLOW = BLUE = CYAN = MAGENTA = WHITE = ""
+from importlib.util import find_spec
+from typing import Dict, Optional, Tuple
+
+# colorama is only imported once colored output is actually needed (see _ensure_colorama)
+COLORS_AVAILABLE = find_spec('colorama') is not None
+_colorama_loaded = False
+
+# Fallback (no color) constants, replaced by colorama's when it gets loaded
+class Fore:
+    RED = GREEN = YELLOW = BLUE = CYAN = MAGENTA = WHITE = ""
+class Style:
+    BRIGHT = DIM = RESET_ALL = ""
+class Back:
+    RED = GREEN = YELLOW = BLUE = CYAN = MAGENTA = WHITE = ""
+_RESET = Style.RESET_ALL
+
+
+def _ensure_colorama() -> None:
+    """Import colorama on first use and swap in its color constants"""
+    global Fore, Style, Back, _RESET, _colorama_loaded
+    if _colorama_loaded:
+        return
+    _colorama_loaded = True
+    try:
+        from colorama import init, Fore, Style, Back
+    except ImportError:
+        return
+    _RESET = Style.RESET_ALL
+    # Cached sequences were built from the fallback constants; rebuild them on demand
+    _ANSI_TABLE.clear()
+    # Only legacy Windows consoles need colorama's stream wrapper; elsewhere ANSI
+    # sequences work natively. No autoreset: _colorize appends the reset sequence itself
+    if sys.platform == 'win32' and sys.stdout.isatty():
+        init(autoreset=False)  # Initialize colorama for cross-platform color support
+
+# Emoji are only used on UTF output streams (avoids encoding issues on Windows consoles)
+_USE_EMOJI = 'utf' in (getattr(sys.stdout, 'encoding', None) or 'utf-8').lower()
+
+# Icons per message type, with plain-text labels for terminals without emoji
+_EMOJI_ICONS = {
+    'error': "❌", 'success': "✅", 'info': "ℹ️", 'warning': "⚠️",
+    'note': "📝", 'edit': "✏️", 'folder': "📁", 'cancel': "❌", 'empty': "❌",
+}
+_TEXT_ICONS = {
+    'error': "ERROR:", 'success': "SUCCESS:", 'info': "INFO:", 'warning': "WARNING:",
+    'note': ">>>", 'edit': "EDIT:", 'folder': "FILES:", 'cancel': "CANCELLED:", 'empty': "WARNING:",
+}
+
+# Accepted answers for the interactive prompts (empty input means "yes")
+_YES = frozenset(('y', 'yes', ''))
+_NO = frozenset(('n', 'no'))
+_EDIT = frozenset(('e', 'edit'))
+
+# Opening/closing ANSI sequences keyed by (color, style), filled on first use
+# and cleared when colorama's constants are swapped in
+_ANSI_TABLE: Dict[Tuple[str, str], Tuple[str, str]] = {}
+
+
+def _build_ansi(color: str, style: str) -> Tuple[str, str]:
+    """Build and cache the (prefix, suffix) sequences for a color/style pair"""
+    # Text with neither color nor style is passed through without any sequences
+    pair = _ANSI_TABLE[(color, style)] = (style + color, _RESET if color or style else "")
+    return pair
+
+
+def _identity_colorize(text: str, color: str = "", style: str = "") -> str:
+    """Stand-in for UserInterface._colorize when colors are disabled"""
+    return text
+
 
 class UserInterface:
     """Handles user interaction and display with color formatting"""
 
     def __init__(self):
-        self.colors_enabled = COLORS_AVAILABLE and sys.stdout.isatty()
-        # Check if we can use emoji characters (avoid encoding issues on Windows)
-        self.use_emoji = self._can_use_emoji()
+        self._colors_enabled = COLORS_AVAILABLE and sys.stdout.isatty()
+        self._use_emoji = _USE_EMOJI
+        self._bind_colorize()
+        self._build_prefixes()
 
-    def _can_use_emoji(self) -> bool:
-        """Check if the terminal can handle emoji characters"""
-        try:
-            # Try to encode a simple emoji
-            "✅".encode(sys.stdout.encoding or 'utf-8')
-            return True
-        except (UnicodeEncodeError, LookupError):
-            return False
+    @property
+    def colors_enabled(self) -> bool:
+        return self._colors_enabled
 
-    def _colorize(self, text: str, color: str = "", style: str = "") -> str:
-        """Apply color and style to text if colors are enabled"""
-        if not self.colors_enabled:
-            return text
-        return f"{style}{color}{text}{Style.RESET_ALL}"
+    @colors_enabled.setter
+    def colors_enabled(self, value: bool) -> None:
+        self._colors_enabled = value
+        self._bind_colorize()
+        self._build_prefixes()
 
-    def show_proposed_message(self, message: str) -> str:
-        """
-        Show proposed commit message and get user confirmation
-        Returns: 'y' for yes, 'n' for no, 'e' for edit
-        """
-        print()
-        icon = "📝" if self.use_emoji else ">>>"
-        print(self._colorize(f"{icon} Proposed commit message:", Fore.CYAN, Style.BRIGHT))
-        print()
+    @property
+    def use_emoji(self) -> bool:
+        return self._use_emoji
+
+    @use_emoji.setter
+    def use_emoji(self, value: bool) -> None:
+        self._use_emoji = value
+        self._build_prefixes()
+
+    def _bind_colorize(self) -> None:
+        """Shadow _colorize with a no-op when colors are disabled, loading colorama otherwise"""
+        if self._colors_enabled:
+            _ensure_colorama()
+            self.__dict__.pop('_colorize', None)
+        else:
+            self._colorize = _identity_colorize
+
+    def _build_prefixes(self) -> None:
+        """Precompute the static icon/label prefixes for the current color and emoji settings"""
+        icons = self._icons = _EMOJI_ICONS if self.use_emoji else _TEXT_ICONS
+        # Line terminator for the show_* messages: just a newline when colors are off
+        self._line_end = _RESET + "\n" if self.colors_enabled else "\n"
+
+        def prefix(icon: str, color: str, style: str = "") -> str:
+            if not self.colors_enabled:
+                return f"{icon} "
+            pre, _ = _ANSI_TABLE.get((color, style)) or _build_ansi(color, style)
+            return f"{pre}{icon} "
 
-        # Display the message with highlighting
-        print(self._colorize(f"  {message}", Fore.GREEN, Style.BRIGHT))
-        print()
+        self._error_prefix = prefix(icons['error'], Fore.RED, Style.BRIGHT)
+        self._success_prefix = prefix(icons['success'], Fore.GREEN, Style.BRIGHT)
+        self._info_prefix = prefix(icons['info'], Fore.BLUE)
+        self._warning_prefix = prefix(icons['warning'], Fore.YELLOW, Style.BRIGHT)
 
-        # Show options with colors
-        options_text = (
+        self._proposed_header = self._colorize(
+            f"{icons['note']} Proposed commit message:", Fore.CYAN, Style.BRIGHT
+        )
+        self._options_text = (
             f"{self._colorize('y', Fore.GREEN, Style.BRIGHT)} = use this message  "
             f"{self._colorize('n', Fore.RED, Style.BRIGHT)} = cancel  "
             f"{self._colorize('e', Fore.YELLOW, Style.BRIGHT)} = edit"
         )
-        print(f"Use this message? ({options_text}): ", end="")
+        self._edit_header = self._colorize(
+            f"{icons['edit']} Editing commit message:", Fore.YELLOW, Style.BRIGHT
+        )
+        self._folder_header = self._colorize(
+            f"{icons['folder']} Modified files:", Fore.CYAN, Style.BRIGHT
+        )
+
+    def _colorize(self, text: str, color: str = "", style: str = "") -> str:
+        """Apply color and style to text (rebound to a no-op while colors are disabled)"""
+        pre, post = _ANSI_TABLE.get((color, style)) or _build_ansi(color, style)
+        return pre + text + post
+
+    def show_proposed_message(self, message: str) -> str:
+        """
+        Show proposed commit message and get user confirmation
+        Returns: 'y' for yes, 'n' for no, 'e' for edit
+        """
+        # Header, highlighted message and prompt go out in a single write
+        parts = [
+            "",
+            self._proposed_header,
+            "",
+            self._colorize(f"  {message}", Fore.GREEN, Style.BRIGHT),
+            "",
+            f"Use this message? ({self._options_text}): ",
+        ]
+        sys.stdout.write("\n".join(parts))
+        sys.stdout.flush()
 
         while True:
             try:
-                response = input().lower().strip()
-                if response in ['y', 'yes', '']:
+                response = input().strip().lower()
+                if response in _YES:
                     return 'y'
-                elif response in ['n', 'no']:
+                elif response in _NO:
                     return 'n'
-                elif response in ['e', 'edit']:
+                elif response in _EDIT:
                     return 'e'
                 else:
                     print(f"Please enter {self._colorize('y', Fore.GREEN)}, {self._colorize('n', Fore.RED)}, or {self._colorize('e', Fore.YELLOW)}: ", end="")
@@ -85,18 +185,19 @@ class UserInterface:
         Allow user to edit the commit message
         Returns the edited message or None if cancelled
         """
-        print()
-        icon = "✏️" if self.use_emoji else "EDIT:"
-        print(self._colorize(f"{icon} Editing commit message:", Fore.YELLOW, Style.BRIGHT))
-        print(self._colorize("(Press Enter for an empty line to finish, Ctrl+C to cancel)", Fore.YELLOW))
-        print()
-
-        # Show current message
-        print(self._colorize("Current message:", Fore.CYAN))
-        print(f"  {message}")
-        print()
-
-        print(self._colorize("New message:", Fore.CYAN))
+        # Header, current message and the new message prompt go out in a single write
+        parts = [
+            "",
+            self._edit_header,
+            self._colorize("(Press Enter for an empty line to finish, Ctrl+C to cancel)", Fore.YELLOW),
+            "",
+            self._colorize("Current message:", Fore.CYAN),
+            f"  {message}",
+            "",
+            self._colorize("New message:", Fore.CYAN),
+        ]
+        sys.stdout.write("\n".join(parts) + "\n")
+        sys.stdout.flush()
 
         lines = []
         try:
@@ -109,57 +210,47 @@ class UserInterface:
                     break
         except (EOFError, KeyboardInterrupt):
             print()
-            cancel_icon = "❌" if self.use_emoji else "CANCELLED:"
-            print(self._colorize(f"{cancel_icon} Edit cancelled", Fore.RED))
+            print(self._colorize(f"{self._icons['cancel']} Edit cancelled", Fore.RED))
             return None
 
-        edited_message = "\n".join(lines).strip()
+        # Single-line edits (the common case) skip the join
+        edited_message = lines[0].strip() if len(lines) == 1 else "\n".join(lines).strip()
         if not edited_message:
-            warning_icon = "❌" if self.use_emoji else "WARNING:"
-            print(self._colorize(f"{warning_icon} Empty message, using original message", Fore.YELLOW))
+            print(self._colorize(f"{self._icons['empty']} Empty message, using original message", Fore.YELLOW))
             return message
 
         return edited_message
 
     def show_error(self, error: str) -> None:
         """Display error message to user with red color"""
-        error_icon = "❌" if self.use_emoji else "ERROR:"
-        colored_error = self._colorize(f"{error_icon} {error}", Fore.RED, Style.BRIGHT)
-        print(colored_error, file=sys.stderr)
+        sys.stderr.write(self._error_prefix + error + self._line_end)
 
     def show_success(self, message: str) -> None:
         """Display success message to user with green color"""
-        success_icon = "✅" if self.use_emoji else "SUCCESS:"
-        colored_message = self._colorize(f"{success_icon} {message}", Fore.GREEN, Style.BRIGHT)
-        print(colored_message)
+        sys.stdout.write(self._success_prefix + message + self._line_end)
 
     def show_info(self, message: str) -> None:
         """Display informational message to user with blue color"""
-        info_icon = "ℹ️" if self.use_emoji else "INFO:"
-        colored_message = self._colorize(f"{info_icon} {message}", Fore.BLUE)
-        print(colored_message)
+        sys.stdout.write(self._info_prefix + message + self._line_end)
 
     def show_warning(self, message: str) -> None:
         """Display warning message to user with yellow color"""
-        warning_icon = "⚠️" if self.use_emoji else "WARNING:"
-        colored_message = self._colorize(f"{warning_icon} {message}", Fore.YELLOW, Style.BRIGHT)
-        print(colored_message)
+        sys.stdout.write(self._warning_prefix + message + self._line_end)
 
     def show_diff_summary(self, files: list, additions: int = 0, deletions: int = 0) -> None:
         """Display a summary of changed files with formatting"""
         if not files:
             return
 
-        print()
-        folder_icon = "📁" if self.use_emoji else "FILES:"
-        print(self._colorize(f"{folder_icon} Modified files:", Fore.CYAN, Style.BRIGHT))
+        # Build the whole summary and emit it with a single write
+        parts = ["", self._folder_header]
 
-        for file in files[:5]:  # Show max 5 files
-            print(f"  • {self._colorize(file, Fore.WHITE)}")
+        colorize = self._colorize
+        parts.extend(f"  • {colorize(file, Fore.WHITE)}" for file in files[:5])  # Show max 5 files
 
         if len(files) > 5:
             remaining = len(files) - 5
-            print(f"  ... and {self._colorize(str(remaining), Fore.YELLOW)} more files")
+            parts.append(f"  ... and {self._colorize(str(remaining), Fore.YELLOW)} more files")
 
         if additions > 0 or deletions > 0:
             stats = []
@@ -167,8 +258,11 @@ class UserInterface:
                 stats.append(self._colorize(f"+{additions}", Fore.GREEN))
             if deletions > 0:
                 stats.append(self._colorize(f"-{deletions}", Fore.RED))
-            print(f"  ({' '.join(stats)})")
-        print()
+            parts.append(f"  ({' '.join(stats)})")
+        parts.append("")
+
+        sys.stdout.write("\n".join(parts) + "\n")
+        sys.stdout.flush()
 
     def confirm_action(self, message: str, default: bool = False) -> bool:
         """
@@ -179,10 +273,10 @@ class UserInterface:
         prompt = f"{message} ({default_text}): "
 
         try:
-            response = input(prompt).lower().strip()
+            response = input(prompt).strip().lower()
             if response == "":
                 return default
-            return response in ['y', 'yes']
+            return response in _YES
         except (EOFError, KeyboardInterrupt):
             print()
             return False
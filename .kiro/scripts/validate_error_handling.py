@@ -4,44 +4,49 @@ Validation script for error handling scenarios in Kiro Commit Buddy
 This script tests various error conditions to ensure proper handling
 """
 
+import io
 import os
 import sys
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from functools import partial
 from pathlib import Path
 
 # Add the scripts directory to Python path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from git_operations import GitOperations, GitOperationError
-from groq_client import GroqClient, GroqAPIError
-from message_generator import MessageGenerator
-from config import Config
-from user_interface import UserInterface
+# The Kiro Commit Buddy modules are imported inside each test on purpose: they pull
+# in requests and friends, and deferring them keeps script startup cheap.
 
 
-def test_git_error_handling():
+def test_git_error_handling(out):
     """Test Git-related error handling"""
-    print("🔍 Testing Git error handling...")
+    out("🔍 Testing Git error handling...")
+    from git_operations import GitOperations
     
     git_ops = GitOperations()
     
     # Test Git environment validation
     is_valid, error_msg = git_ops.validate_git_environment()
     if is_valid:
-        print("✅ Git environment is valid")
+        out("✅ Git environment is valid")
     else:
-        print(f"❌ Git environment error: {error_msg}")
+        out(f"❌ Git environment error: {error_msg}")
     
     # Test staged changes check
     has_changes, status_msg, files = git_ops.check_staged_changes()
-    print(f"📁 Staged changes status: {status_msg}")
+    out(f"📁 Staged changes status: {status_msg}")
     
     return True
 
 
-def test_api_error_handling():
+def test_api_error_handling(out):
     """Test API error handling scenarios"""
-    print("\n🔍 Testing API error handling...")
+    out("\n🔍 Testing API error handling...")
+    from config import Config
+    from groq_client import GroqClient, GroqAPIError
     
     config = Config()
     
@@ -50,21 +55,21 @@ def test_api_error_handling():
     config.GROQ_API_KEY = ""
     
     try:
-        client = GroqClient(config)
-        print("❌ Should have failed with no API key")
+        GroqClient.validate_api_key(config)
+        out("❌ Should have failed with no API key")
         return False
     except GroqAPIError as e:
-        print(f"✅ Correctly handled missing API key: {str(e)[:50]}...")
+        out(f"✅ Correctly handled missing API key: {str(e)[:50]}...")
     
     # Test with invalid API key format
     config.GROQ_API_KEY = "invalid-key"
     
     try:
-        client = GroqClient(config)
-        print("❌ Should have failed with invalid API key format")
+        GroqClient.validate_api_key(config)
+        out("❌ Should have failed with invalid API key format")
         return False
     except GroqAPIError as e:
-        print(f"✅ Correctly handled invalid API key format: {str(e)[:50]}...")
+        out(f"✅ Correctly handled invalid API key format: {str(e)[:50]}...")
     
     # Restore original key
     config.GROQ_API_KEY = original_key
@@ -72,9 +77,11 @@ def test_api_error_handling():
     return True
 
 
-def test_message_generation_fallback():
+def test_message_generation_fallback(out):
     """Test message generation fallback scenarios"""
-    print("\n🔍 Testing message generation fallback...")
+    out("\n🔍 Testing message generation fallback...")
+    from config import Config
+    from message_generator import MessageGenerator
     
     config = Config()
     generator = MessageGenerator(config)
@@ -89,19 +96,23 @@ def test_message_generation_fallback():
         ([f"file{i}.py" for i in range(6)], "feat")
     ]
     
-    for files, expected_type in test_cases:
-        message = generator.generate_fallback_message(files)
+    # The cases are independent, so generate them concurrently and report in order
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        messages = list(executor.map(generator.generate_fallback_message, [files for files, _ in test_cases]))
+    
+    for (files, expected_type), message in zip(test_cases, messages):
         if message.startswith(f"{expected_type}:"):
-            print(f"✅ Correct fallback for {files}: {message}")
+            out(f"✅ Correct fallback for {files}: {message}")
         else:
-            print(f"❌ Incorrect fallback for {files}: {message} (expected {expected_type}:)")
+            out(f"❌ Incorrect fallback for {files}: {message} (expected {expected_type}:)")
     
     return True
 
 
-def test_user_interface_error_handling():
+def test_user_interface_error_handling(out):
     """Test user interface error handling"""
-    print("\n🔍 Testing user interface error handling...")
+    out("\n🔍 Testing user interface error handling...")
+    from user_interface import UserInterface
     
     ui = UserInterface()
     
@@ -111,31 +122,71 @@ def test_user_interface_error_handling():
     ui.show_info("Test info message")
     ui.show_success("Test success message")
     
-    print("✅ User interface error display methods work correctly")
-    
+    out("✅ User interface error display methods work correctly")
     return True
 
 
-def test_config_error_handling():
+def test_config_error_handling(out):
     """Test configuration error handling"""
-    print("\n🔍 Testing configuration error handling...")
+    out("\n🔍 Testing configuration error handling...")
+    from config import Config
     
     config = Config()
     
     # Test API key validation
     has_key = config.has_groq_api_key()
-    print(f"✅ API key availability check: {has_key}")
+    out(f"✅ API key availability check: {has_key}")
     
     # Test configuration values
-    print(f"✅ Max diff size: {config.MAX_DIFF_SIZE}")
-    print(f"✅ Timeout setting: {config.TIMEOUT}")
-    print(f"✅ Groq model: {config.GROQ_MODEL}")
+    out(f"✅ Max diff size: {config.MAX_DIFF_SIZE}")
+    out(f"✅ Timeout setting: {config.TIMEOUT}")
+    out(f"✅ Groq model: {config.GROQ_MODEL}")
     
     return True
 
 
+# Per-thread stdout/stderr capture buffers used while the validation tests run concurrently
+_captured = threading.local()
+
+
+class _ThreadOutput(io.TextIOBase):
+    """Stream stand-in that sends each worker thread's output to its own buffer"""
+
+    def __init__(self, fallback, name):
+        self._fallback = fallback
+        self._name = name
+
+    def write(self, text):
+        return getattr(_captured, self._name, self._fallback).write(text)
+
+    def flush(self):
+        getattr(_captured, self._name, self._fallback).flush()
+
+
+def _run_buffered(test):
+    """
+    Run one validation test, returning its outcome and its stdout/stderr output
+    Tests print their report lines through the out callable they are given, into
+    the same buffer as anything the code under test writes, in execution order
+    """
+    buffer = _captured.stdout = io.StringIO()
+    errors = _captured.stderr = io.StringIO()
+    out = partial(print, file=buffer)
+    passed = False
+    try:
+        passed = test(out)
+    except Exception as e:
+        out(f"❌ Test {test.__name__} failed with exception: {e}")
+    finally:
+        del _captured.stdout, _captured.stderr
+    return bool(passed), buffer.getvalue(), errors.getvalue()
+
+
 def main():
     """Run all error handling validation tests"""
+    # Load the logger before the tests start: in verbose mode it announces itself on
+    # import, and that line belongs before the banner, not inside whichever test imports it
+    import verbose_logger
     print("🚀 Starting Kiro Commit Buddy Error Handling Validation\n")
     
     tests = [
@@ -149,12 +200,22 @@ def main():
     passed = 0
     total = len(tests)
     
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-        except Exception as e:
-            print(f"❌ Test {test.__name__} failed with exception: {e}")
+    # The tests are independent and mostly wait on git, so run them concurrently
+    # and replay each one's output in order once they have all finished
+    with redirect_stdout(_ThreadOutput(sys.stdout, 'stdout')), \
+            redirect_stderr(_ThreadOutput(sys.stderr, 'stderr')):
+        with ThreadPoolExecutor(max_workers=total) as executor:
+            futures = [executor.submit(_run_buffered, test) for test in tests]
+            results = [future.result() for future in futures]
+
+    for test_passed, output, errors in results:
+        sys.stdout.write(output)
+        if errors:
+            sys.stdout.flush()
+            sys.stderr.write(errors)
+            sys.stderr.flush()
+        if test_passed:
+            passed += 1
     
     print(f"\n📊 Results: {passed}/{total} tests passed")
     
@@ -2,16 +2,36 @@
 Validation script to verify GitOperations implementation
 """
 
-import inspect
-from git_operations import GitOperations
+import ast
+from pathlib import Path
+
+# Source of the module under validation; it is parsed, never imported or executed
+GIT_OPERATIONS_PATH = Path(__file__).parent / "git_operations.py"
+
+
+def _git_operations_methods():
+    """Map each method defined on GitOperations to its positional parameter names"""
+    tree = ast.parse(GIT_OPERATIONS_PATH.read_text(encoding='utf-8'))
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == 'GitOperations':
+            return {
+                item.name: [arg.arg for arg in item.args.args]
+                for item in node.body
+                if isinstance(item, ast.FunctionDef)
+            }
+    raise AssertionError("git_operations.py should define a GitOperations class")
+
 
 def validate_git_operations():
     """Validate that GitOperations class meets all requirements"""
     
     print("Validating GitOperations class implementation...")
     
+    # One pass over the source collects every method and its parameters
+    methods = _git_operations_methods()
+    
     # Check if class exists
-    assert hasattr(GitOperations, '__init__'), "GitOperations class should have __init__ method"
+    assert '__init__' in methods, "GitOperations class should have __init__ method"
     
     # Check required methods exist
     required_methods = [
@@ -22,31 +42,27 @@ def validate_git_operations():
     ]
     
     for method in required_methods:
-        assert hasattr(GitOperations, method), f"GitOperations should have {method} method"
+        assert method in methods, f"GitOperations should have {method} method"
         print(f"✓ {method} method exists")
     
-    # Check method signatures
-    git_ops = GitOperations()
+    # Check method signatures (parameter lists include self)
     
     # is_git_repository should return bool
-    sig = inspect.signature(git_ops.is_git_repository)
-    assert len(sig.parameters) == 0, "is_git_repository should take no parameters"
+    assert methods['is_git_repository'] == ['self'], "is_git_repository should take no parameters"
     print("✓ is_git_repository signature correct")
     
     # get_staged_diff should return str
-    sig = inspect.signature(git_ops.get_staged_diff)
-    assert len(sig.parameters) == 0, "get_staged_diff should take no parameters"
+    assert methods['get_staged_diff'] == ['self'], "get_staged_diff should take no parameters"
     print("✓ get_staged_diff signature correct")
     
     # get_changed_files should return List[str]
-    sig = inspect.signature(git_ops.get_changed_files)
-    assert len(sig.parameters) == 0, "get_changed_files should take no parameters"
+    assert methods['get_changed_files'] == ['self'], "get_changed_files should take no parameters"
     print("✓ get_changed_files signature correct")
     
     # commit_with_message should take message parameter and return bool
-    sig = inspect.signature(git_ops.commit_with_message)
-    assert len(sig.parameters) == 1, "commit_with_message should take one parameter"
-    assert 'message' in sig.parameters, "commit_with_message should have 'message' parameter"
+    params = methods['commit_with_message']
+    assert len(params) == 2, "commit_with_message should take one parameter"
+    assert 'message' in params, "commit_with_message should have 'message' parameter"
     print("✓ commit_with_message signature correct")
     
     print("\n✅ All GitOperations requirements validated successfully!")
@@ -6,22 +6,105 @@ Provides detailed logging to track API call flow and identify failure points
 import os
 import sys
 import json
+import time
+import weakref
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
 from pathlib import Path
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        """Pretty-print obj as JSON for the log (orjson fast path)"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+except ImportError:
+    # orjson is optional (pip install kiro-commit-buddy[dev]); fall back to the stdlib
+    def _dumps(obj: Any) -> str:
+        """Pretty-print obj as JSON for the log"""
+        return json.dumps(obj, indent=2)
+
+# Values of KIRO_COMMIT_BUDDY_VERBOSE that turn verbose logging on
+_VERBOSE_TRUTHY = frozenset({"1", "true", "yes", "on", "y"})
+
+# Read the verbose switch from the environment once, at import
+_VERBOSE_ENV = os.getenv("KIRO_COMMIT_BUDDY_VERBOSE", "").strip().casefold() in _VERBOSE_TRUTHY
+
+# Log directories (resolved) already created by any logger, so repeat setups skip
+# the mkdir; a directory removed later is recreated when opening the log file fails
+_ensured_dirs: Set[Path] = set()
+
+# Raw append-mode descriptors are used for the log file except on Windows,
+# where a buffered text handle is kept instead
+_RAW_LOG_FD = sys.platform != 'win32'
+_LOG_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+
 class VerboseLogger:
     """Centralized logging system with multiple output options"""
 
     def __init__(self, enabled: bool = False, log_file: Optional[str] = None):
         self.enabled = enabled
+        # Open log file sink: a raw descriptor, or a text handle on Windows
+        self._log_fd: Optional[int] = None
+        self._log_handle = None
+        # Closes the open sink when called, when the logger is collected, or at exit
+        self._log_closer: Optional[weakref.finalize] = None
+        # Formatted HH:MM:SS for the last second a line was logged in
+        self._ts_cache_sec = -1
+        self._ts_cache_str = ""
+        # Pre-padded "[LEVEL  ] [COMPONENT]" fields keyed by (level, component)
+        self._prefix_cache: Dict[tuple, str] = {}
+        # Serialized, sanitized request headers keyed by the raw header items
+        self._safe_header_cache: Dict[tuple, str] = {}
         self.log_file = log_file
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    @property
+    def log_file(self) -> Optional[str]:
+        return self._log_file
+
+    @log_file.setter
+    def log_file(self, log_file: Optional[str]) -> None:
+        """Switch the log file sink, closing the handle of the previous one"""
+        self._close_log_file()
+        self._log_file = log_file
         
         # Create logs directory if logging to file
-        if self.log_file:
-            log_path = Path(self.log_file)
-            log_path.parent.mkdir(parents=True, exist_ok=True)
+        if log_file:
+            self._ensure_log_dir()
+
+    def _ensure_log_dir(self, recheck: bool = False) -> None:
+        """Create the log file's directory unless it is known to exist (or recheck is set)"""
+        parent = Path(self._log_file).resolve().parent
+        if recheck or parent not in _ensured_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            _ensured_dirs.add(parent)
+
+    def _open_log_file(self) -> None:
+        """Open the persistent log sink, recreating its directory if it was removed"""
+        try:
+            self._open_log_sink()
+        except FileNotFoundError:
+            # The directory was created earlier but has gone away since; retry once
+            self._ensure_log_dir(recheck=True)
+            self._open_log_sink()
+
+    def _open_log_sink(self) -> None:
+        """Open the raw append descriptor, or a buffered text handle on Windows"""
+        if _RAW_LOG_FD:
+            self._log_fd = os.open(self.log_file, _LOG_FLAGS, 0o644)
+            self._log_closer = weakref.finalize(self, os.close, self._log_fd)
+        else:
+            self._log_handle = open(self.log_file, 'a', encoding='utf-8', buffering=8192)
+            self._log_closer = weakref.finalize(self, self._log_handle.close)
+
+    def _close_log_file(self):
+        """Close the persistent log file descriptor or handle, if open"""
+        if self._log_closer is not None:
+            self._log_closer()
+            self._log_closer = None
+        self._log_fd = None
+        self._log_handle = None
 
     def enable(self):
         """Enable verbose logging"""
@@ -43,8 +126,17 @@ class VerboseLogger:
         if not self.enabled:
             return
 
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]  # Include milliseconds
-        log_entry = f"[{timestamp}] [{level:7}] [{component:8}] {message}"
+        # Only reformat the clock once per second; milliseconds are appended per line
+        now = time.time()
+        sec = int(now)
+        if sec != self._ts_cache_sec:
+            self._ts_cache_str = time.strftime("%H:%M:%S", time.localtime(sec))
+            self._ts_cache_sec = sec
+        timestamp = f"{self._ts_cache_str}.{int((now - sec) * 1000):03d}"  # Include milliseconds
+        prefix = self._prefix_cache.get((level, component))
+        if prefix is None:
+            prefix = self._prefix_cache[(level, component)] = f"[{level:7}] [{component:8}]"
+        log_entry = f"[{timestamp}] {prefix} {message}"
         
         # Output to console
         print(log_entry)
@@ -52,25 +144,41 @@ class VerboseLogger:
         # Output to file if configured
         if self.log_file:
             try:
-                with open(self.log_file, 'a', encoding='utf-8') as f:
-                    f.write(log_entry + '\n')
+                # Keep the file open instead of reopening it per line; each entry
+                # goes out as one pre-encoded append on the raw descriptor
+                if self._log_closer is None:
+                    self._open_log_file()
+                if _RAW_LOG_FD:
+                    os.write(self._log_fd, (log_entry + '\n').encode('utf-8'))
+                else:
+                    self._log_handle.write(log_entry + '\n')
+                    if level in ("WARNING", "ERROR"):
+                        self._log_handle.flush()
             except Exception as e:
                 print(f"[ERROR] Failed to write to log file: {e}")
 
     def debug(self, message: str, component: str = "DEBUG"):
         """Log debug message"""
+        if not self.enabled:
+            return
         self.log(message, "DEBUG", component)
 
     def info(self, message: str, component: str = "INFO"):
         """Log info message"""
+        if not self.enabled:
+            return
         self.log(message, "INFO", component)
 
     def warning(self, message: str, component: str = "WARNING"):
         """Log warning message"""
+        if not self.enabled:
+            return
         self.log(message, "WARNING", component)
 
     def error(self, message: str, component: str = "ERROR"):
         """Log error message"""
+        if not self.enabled:
+            return
         self.log(message, "ERROR", component)
 
     def log_api_request(self, endpoint: str, headers: Dict[str, Any], payload: Dict[str, Any]):
@@ -78,12 +186,20 @@ class VerboseLogger:
         if not self.enabled:
             return
 
-        # Sanitize headers (hide API key)
-        safe_headers = {k: (v[:20] + "..." if k == "Authorization" else v) for k, v in headers.items()}
+        # Sanitize headers (hide API key); requests reuse the same headers, so cache the result
+        cache_key = tuple(headers.items())
+        safe_headers_json = self._safe_header_cache.get(cache_key)
+        if safe_headers_json is None:
+            safe_headers = {k: (v[:20] + "..." if k == "Authorization" else v) for k, v in headers.items()}
+            safe_headers_json = _dumps(safe_headers)
+            if len(self._safe_header_cache) >= 16:
+                # Evict the oldest entry
+                del self._safe_header_cache[next(iter(self._safe_header_cache))]
+            self._safe_header_cache[cache_key] = safe_headers_json
         
         self.debug(f"API Request to: {endpoint}", "API")
-        self.debug(f"Headers: {json.dumps(safe_headers, indent=2)}", "API")
-        self.debug(f"Payload: {json.dumps(payload, indent=2)}", "API")
+        self.debug(f"Headers: {safe_headers_json}", "API")
+        self.debug(f"Payload: {_dumps(payload)}", "API")
 
     def log_api_response(self, status_code: int, headers: Dict[str, Any], response_data: Any):
         """Log API response details"""
@@ -91,10 +207,12 @@ class VerboseLogger:
             return
 
         self.debug(f"API Response Status: {status_code}", "API")
-        self.debug(f"Response Headers: {dict(headers)}", "API")
+        # Same text as dict(headers) would print, without copying the headers into a new dict
+        header_text = ", ".join(f"{k!r}: {v!r}" for k, v in headers.items())
+        self.debug(f"Response Headers: {{{header_text}}}", "API")
         
         if isinstance(response_data, dict):
-            self.debug(f"Response Data: {json.dumps(response_data, indent=2)}", "API")
+            self.debug(f"Response Data: {_dumps(response_data)}", "API")
         else:
             self.debug(f"Response Data: {str(response_data)[:500]}...", "API")
 
@@ -114,9 +232,13 @@ class VerboseLogger:
         if not self.enabled:
             return
 
-        self.debug(f"Message Source: {source}", "MSG_GEN")
-        self.debug(f"Input Length: {len(input_data)} chars", "MSG_GEN")
-        self.debug(f"Generated Message: {output_message}", "MSG_GEN")
+        # Cap long generated messages like response data; enabled is already checked above
+        if len(output_message) > 500:
+            output_message = output_message[:500] + "..."
+
+        self.log(f"Message Source: {source}", "DEBUG", "MSG_GEN")
+        self.log(f"Input Length: {len(input_data)} chars", "DEBUG", "MSG_GEN")
+        self.log(f"Generated Message: {output_message}", "DEBUG", "MSG_GEN")
 
     def log_fallback_trigger(self, reason: str, context: Dict[str, Any]):
         """Log when fallback is triggered and why"""
@@ -124,7 +246,7 @@ class VerboseLogger:
             return
 
         self.warning(f"Fallback triggered: {reason}", "FALLBACK")
-        self.debug(f"Fallback context: {json.dumps(context, indent=2)}", "FALLBACK")
+        self.debug(f"Fallback context: {_dumps(context)}", "FALLBACK")
 
     def log_user_interaction(self, action: str, details: str):
         """Log user interactions"""
@@ -151,14 +273,12 @@ def get_logger() -> VerboseLogger:
 
 def enable_verbose_logging(log_file: Optional[str] = None):
     """Enable verbose logging globally"""
-    global _global_logger
     _global_logger.enabled = True
     if log_file:
         _global_logger.log_file = log_file
 
 def disable_verbose_logging():
     """Disable verbose logging globally"""
-    global _global_logger
     _global_logger.enabled = False
 
 def is_verbose_enabled() -> bool:
@@ -166,6 +286,6 @@ def is_verbose_enabled() -> bool:
     return _global_logger.enabled
 
 # Environment variable check
-if os.getenv("KIRO_COMMIT_BUDDY_VERBOSE", "").lower() in ["1", "true", "yes"]:
+if _VERBOSE_ENV:
     enable_verbose_logging()
     _global_logger.info("Verbose logging enabled via environment variable", "INIT")
\ No newline at end of file